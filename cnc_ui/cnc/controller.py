@@ -4,7 +4,9 @@ CNC controller interface - provides methods for controlling the CNC machine.
 This implementation communicates with Marlin firmware via serial.
 """
 
+import functools
 import json
+import operator
 import re
 import time
 import threading
@@ -27,11 +29,12 @@ _LAST_LINE_RE = re.compile(r"Last\s*Line\s*:\s*(\d+)", re.IGNORECASE)
 
 
 def _marlin_checksum(payload: str) -> int:
-    """XOR-of-bytes checksum used by Marlin for line-numbered commands."""
-    cs = 0
-    for b in payload.encode('utf-8'):
-        cs ^= b
-    return cs & 0xff
+    """XOR-of-bytes checksum used by Marlin for line-numbered commands.
+
+    Computed for every streamed (and resent) line, so the fold runs in C
+    via reduce/operator.xor rather than as a bytecode loop per byte.
+    """
+    return functools.reduce(operator.xor, payload.encode('utf-8'), 0) & 0xff
 
 try:
     # Structured logging helpers — present whenever main.py has been imported.
@@ -743,7 +746,7 @@ class CNCController:
         except Exception as e:
             logger.error(f"Error parsing position '{line}': {e}", exc_info=True)
     
-    def jog(self, axis: str, distance: float, feed_rate: float) -> None:
+    def jog(self, axis: str, distance: float, feed_rate: float) -> bool:
         """
         Jog a single axis by the specified distance.
         
@@ -751,10 +754,13 @@ class CNCController:
             axis: Axis to jog ('X', 'Y', 'Z', or 'A')
             distance: Distance to jog in mm (or degrees for A)
             feed_rate: Feed rate in mm/min (or deg/min for A)
+            
+        Returns:
+            False if the jog was refused (machine busy or not connected)
         """
         if not machine_state.is_idle() or not self.connected:
             logger.warning(f"Cannot jog: idle={machine_state.is_idle()}, connected={self.connected}")
-            return
+            return False
         
         # Set slower acceleration for jogging (gentler motion)
         self._send_command("M204 P500 T500")  # Jog accel 500 mm/s²
@@ -779,6 +785,7 @@ class CNCController:
         self._send_command("M400")  # Wait for move to finish
         self._send_command("M204 P2000 T3000")  # Restore fast acceleration
         self._send_command("M114")  # Request position update
+        return True
     
     def jog_xy(self, x_distance: float, y_distance: float, feed_rate: float) -> None:
         """
@@ -1092,6 +1099,7 @@ class CNCController:
         
         sent_count = 1  # We've already sent M110 N0 — counts toward the ok we expect
         last_progress_log = 0
+        last_progress_push = 0.0  # monotonic time of the last progress update
         
         # Debug timing
         job_start_time = time.time()
@@ -1185,7 +1193,11 @@ class CNCController:
                 # confirmed (1-indexed; N1 == commands[0]).
                 committed = self.committed_line
                 progress = min(1.0, committed / total_commands) if total_commands > 0 else 1.0
-                machine_state.update_job_progress(progress)
+                # Pushed to the UI at most 10x/s; the final 1.0 is set when the job ends
+                now = time.monotonic()
+                if now - last_progress_push >= 0.1:
+                    last_progress_push = now
+                    machine_state.update_job_progress(progress)
                 
                 # Log progress every 10%
                 progress_pct = int(progress * 10)
@@ -50,6 +50,23 @@ class FileManager:
         
         return str(destination)
     
+    def save_uploaded_bytes(self, content: bytes, filename: str) -> str:
+        """
+        Save uploaded file contents straight to the uploads directory.
+        
+        Args:
+            content: Raw file contents already held in memory
+            filename: Original filename
+            
+        Returns:
+            Path to the saved file
+        """
+        safe_filename = self._sanitize_filename(filename)
+        destination = self.upload_dir / safe_filename
+        destination.write_bytes(content)
+        
+        return str(destination)
+    
     def get_gcode_stub(self, filepath: str) -> list[str]:
         """
         Generate stub G-code for a DXF file.
@@ -4,10 +4,42 @@ Shared machine and job state for the CNC controller.
 Thread-safe state object that tracks machine position, status, and job progress.
 """
 
+import asyncio
 import threading
 from dataclasses import dataclass, field
 from typing import Optional
 
+from nicegui.binding import BindableProperty
+
+
+class MachineFlags:
+    """
+    UI-facing copy of the machine status flags, for widget bindings.
+    
+    BindableProperties push to bound widgets on assignment instead of being
+    polled on every binding refresh. That push touches NiceGUI's outbox, so
+    these are only ever assigned on the event loop, by
+    MachineState._publish_flags(); the controller threads update the plain
+    fields on MachineState instead.
+    """
+    
+    busy = BindableProperty()
+    paused = BindableProperty()
+    idle = BindableProperty()         # not busy and not paused
+    running = BindableProperty()      # busy and not paused
+    can_outline = BindableProperty()  # job loaded and idle
+    can_start = BindableProperty()    # toolpath generated and idle
+    job_progress = BindableProperty()  # 0.0 to 1.0
+    
+    def __init__(self) -> None:
+        self.busy = False
+        self.paused = False
+        self.idle = True
+        self.running = False
+        self.can_outline = False
+        self.can_start = False
+        self.job_progress = 0.0
+
 
 @dataclass
 class MachineState:
@@ -40,6 +72,49 @@ class MachineState:
     # Thread lock for safe concurrent access
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
     
+    # Bindable flags for the UI, published on the event loop (see attach_loop)
+    flags: MachineFlags = field(default_factory=MachineFlags, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(default=None, repr=False)
+    _publish_pending: bool = field(default=False, repr=False)
+    
+    def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Publish flag changes on `loop` from now on (call once at startup)."""
+        with self._lock:
+            self._loop = loop
+        self._publish_flags()
+    
+    def _schedule_publish(self) -> None:
+        """Queue a flags publish on the event loop (call with the lock held).
+        
+        Safe from any thread; several transitions before the loop gets to it
+        collapse into one publish of the latest state.
+        """
+        if self._loop is None or self._publish_pending:
+            return
+        self._publish_pending = True
+        try:
+            self._loop.call_soon_threadsafe(self._publish_flags)
+        except RuntimeError:  # loop already closed (shutdown)
+            self._publish_pending = False
+    
+    def _publish_flags(self) -> None:
+        """Copy a consistent snapshot into the bindable flags (event loop only)."""
+        with self._lock:
+            self._publish_pending = False
+            idle = not self.busy and not self.paused
+            values = {
+                'busy': self.busy,
+                'paused': self.paused,
+                'idle': idle,
+                'running': self.busy and not self.paused,
+                'can_outline': self.job_loaded and idle,
+                'can_start': self.toolpath_generated and idle,
+                'job_progress': self.job_progress,
+            }
+        # Assigned outside the lock: each assignment updates bound widgets
+        for name, value in values.items():
+            setattr(self.flags, name, value)
+    
     def update_position(self, x: Optional[float] = None, y: Optional[float] = None, 
                        z: Optional[float] = None, a: Optional[float] = None) -> None:
         """Update machine position (thread-safe)."""
@@ -59,6 +134,7 @@ class MachineState:
             self.status_text = status
             self.busy = busy
             self.paused = paused
+            self._schedule_publish()
     
     def set_job_loaded(self, loaded: bool, filename: Optional[str] = None) -> None:
         """Update job loaded status (thread-safe)."""
@@ -70,11 +146,20 @@ class MachineState:
             else:
                 self.status_text = "Idle"
                 self.job_progress = 0.0
+            self._schedule_publish()
     
     def update_job_progress(self, progress: float) -> None:
-        """Update job progress (thread-safe)."""
+        """Update job progress (thread-safe).
+        
+        Quantized to whole percent: the controller reports progress per streamed
+        line, far finer than the progress bar can show, and every change of the
+        published value is pushed to each open page.
+        """
         with self._lock:
-            self.job_progress = max(0.0, min(1.0, progress))
+            progress = round(max(0.0, min(1.0, progress)) * 100) / 100
+            if progress != self.job_progress:
+                self.job_progress = progress
+                self._schedule_publish()
     
     def get_position(self) -> tuple[float, float, float, float]:
         """Get current position (thread-safe)."""
@@ -82,12 +167,19 @@ class MachineState:
             return (self.x, self.y, self.z, self.a)
     
     def is_idle(self) -> bool:
-        """Check if machine is idle and ready for new commands (thread-safe)."""
+        """Check if machine is idle and ready for new commands (thread-safe).
+        
+        Reads both status flags under the lock, so a concurrent set_status()
+        can't be seen half-applied.
+        """
         with self._lock:
             return not self.busy and not self.paused
     
     def is_running(self) -> bool:
-        """Check if machine is currently running a job (thread-safe)."""
+        """Check if machine is currently running a job (thread-safe).
+        
+        Reads both status flags under the lock, like is_idle().
+        """
         with self._lock:
             return self.busy and not self.paused
     
@@ -101,11 +193,13 @@ class MachineState:
                 self.status_text = f"Loaded: {self.loaded_filename}"
             else:
                 self.status_text = "Idle"
+            self._schedule_publish()
     
     def set_toolpath_generated(self, generated: bool) -> None:
         """Set whether toolpath has been generated (thread-safe)."""
         with self._lock:
             self.toolpath_generated = generated
+            self._schedule_publish()
 
 
 # Global machine state instance
@@ -30,9 +30,10 @@ from cnc.controller import cnc_controller
 from cnc.files import file_manager
 from pathlib import Path
 from fastapi import Request
-from fastapi.responses import StreamingResponse, JSONResponse
+from fastapi.responses import StreamingResponse, JSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 import matplotlib.pyplot as plt
+import numpy as np
 from dxf_processing.dxf_processor import DXFProcessor
 from toolpath_planning.toolpath_generator import ToolpathGenerator
 from toolpath_planning.gcode_visualizer import GCodeVisualizer
@@ -44,14 +45,26 @@ import os
 import math
 import json
 import asyncio
+import base64
+import collections
+import concurrent.futures
+import functools
+import hashlib
 import io
 import zipfile
 import re
 import fcntl
 import termios
 import struct
+import time
+from dataclasses import dataclass, asdict
 from datetime import datetime
 
+try:
+    import orjson  # optional C-accelerated JSON encoder for large point lists
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Application version
@@ -63,8 +76,28 @@ REPO_DIR = Path(__file__).parent.parent
 # Update check state
 update_state = {'available': False}
 
+class _VersionedStaticFiles(StaticFiles):
+    """StaticFiles that marks ?v=<APP_VERSION> URLs as immutable.
+
+    The page head references theme.css and the page scripts with the app
+    version in the query string, so a cached copy can never be stale; the
+    browser skips revalidating them on every kiosk reload.
+    """
+
+    def file_response(self, *args, **kwargs):
+        response = super().file_response(*args, **kwargs)
+        scope = kwargs.get('scope', args[2] if len(args) > 2 else None)
+        if scope and b'v=' in scope.get('query_string', b''):
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response
+
+
 # Mount static files directory
-app.mount('/static', StaticFiles(directory=Path(__file__).parent / 'static'), name='static')
+app.mount('/static', _VersionedStaticFiles(directory=Path(__file__).parent / 'static'), name='static')
+
+# The controller threads update machine_state; its bindable UI flags are
+# republished on the server's event loop, captured here once it is running
+app.on_startup(lambda: machine_state.attach_loop(asyncio.get_running_loop()))
 
 
 # === SOCKET.IO LIFECYCLE LOGGING =====================================
@@ -205,19 +238,32 @@ def logs_status():
     return JSONResponse({'config': safe_cfg, 'files': files, 'uploader_state': state})
 
 
+# Cached result of the local-IP probe (None until a probe succeeds)
+_local_ip = {'value': None}
+
+
 def get_local_ip():
-    """Get the local IP address of this machine."""
+    """Get the local IP address of this machine (probed once, then cached)."""
+    if _local_ip['value'] is not None:
+        return _local_ip['value']
     try:
-        # Create a socket to determine the local IP
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect(("8.8.8.8", 80))
-        ip = s.getsockname()[0]
-        s.close()
+        # Create a socket to determine the local IP (closed even when there's
+        # no route yet and connect() raises)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            ip = s.getsockname()[0]
+        _local_ip['value'] = ip
         return ip
     except Exception:
+        # Not cached — no route yet (e.g. WiFi still coming up), so re-probe next time
         return "127.0.0.1"
 
 
+def refresh_local_ip():
+    """Drop the cached local IP so the next get_local_ip() re-probes."""
+    _local_ip['value'] = None
+
+
 # Jog parameters (user-adjustable)
 jog_params = {
     'xy_step': 10.0,  # mm
@@ -273,27 +319,69 @@ current_toolpath_types = {}    # name -> [DXF entity type per segment] ('SPLINE'
 current_toolpath_notches = {}  # name -> [{edgeIdx, x, y}, ...]   (active notch nodeKeys)
 toolpath_canvas = None  # Reference to the canvas element
 
-# API endpoint for jog control from JavaScript
-@app.post('/jog')
-async def jog_endpoint(request: Request):
-    """Handle jog requests."""
-    data = await request.json()
-    axis = data['axis']
-    direction = data['direction']
+# jog_params key holding the step size for each axis
+_JOG_STEP_KEY = {'X': 'xy_step', 'Y': 'xy_step', 'Z': 'z_step', 'A': 'a_step'}
+
+# Step jogs arriving within this window are merged per axis into one move,
+# so a burst of taps (or touchscreen repeats) sends one G91/G1/M400 block
+# for their summed distance instead of one per tap. Taps are summed rather
+# than dropped, and the sum is clamped to _JOG_MAX_STEPS steps so a flood of
+# queued taps can't turn into one long move.
+_JOG_COALESCE_S = 0.02
+_JOG_MAX_STEPS = 5
+_pending_jogs = {}  # axis -> [summed distance, tap count] awaiting _flush_jog
+
+
+def _flush_jog(axis):
+    requested, taps = _pending_jogs.pop(axis, (0, 0))
+    limit = jog_params[_JOG_STEP_KEY[axis]] * _JOG_MAX_STEPS
+    distance = max(-limit, min(limit, requested))
+    sent = bool(distance) and cnc_controller.jog(axis, distance, jog_params['feed_rate'])
+    # One record for what actually reached the controller (opposite taps can
+    # cancel out; a busy/disconnected machine refuses the whole burst)
+    log_event('jog', 'jog_sent' if sent else 'jog_not_sent', axis=axis, distance=distance,
+              requested=requested, taps=taps, clamped=distance != requested,
+              feed_rate=jog_params['feed_rate'])
+
+
+def _jog_step(axis, direction, source):
+    """Queue one configured step in `direction` (+1/-1); False for bad input."""
+    step_key = _JOG_STEP_KEY.get(axis)
+    # Exactly one step either way: a bare number here would otherwise become a
+    # move of direction × step (1e6, nan, inf all included); bools are ints
+    if step_key is None or isinstance(direction, bool) or direction not in (1, -1):
+        return False
+    distance = jog_params[step_key] * direction
     
-    if axis == 'X' or axis == 'Y':
-        distance = jog_params['xy_step'] * direction
-    elif axis == 'Z':
-        distance = jog_params['z_step'] * direction
-    elif axis == 'A':
-        distance = jog_params['a_step'] * direction
+    pending = _pending_jogs.get(axis)
+    if pending is not None:
+        pending[0] += distance
+        pending[1] += 1
     else:
-        return {'status': 'error', 'message': 'Invalid axis'}
-    
-    cnc_controller.jog(axis, distance, jog_params['feed_rate'])
+        _pending_jogs[axis] = [distance, 1]
+        asyncio.get_running_loop().call_later(_JOG_COALESCE_S, _flush_jog, axis)
     log_event('jog', 'jog_request', axis=axis, direction=direction, distance=distance,
-              feed_rate=jog_params['feed_rate'], source='js_endpoint')
-    return {'status': 'ok'}
+              feed_rate=jog_params['feed_rate'], source=source)
+    return True
+
+# Fixed /jog response bodies, encoded once — returned as raw Responses so
+# FastAPI skips jsonable_encoder + json.dumps on every jog
+_JOG_OK_BODY = b'{"status":"ok"}'
+_JOG_INVALID_AXIS_BODY = b'{"status":"error","message":"Invalid axis"}'
+_JOG_INVALID_JSON_BODY = b'{"status":"error","message":"Invalid JSON"}'
+
+# API endpoint for jog control from external clients (the page itself uses
+# the 'jog_step' websocket event — see window.jogAxis in static/page.js)
+@app.post('/jog')
+async def jog_endpoint(request: Request):
+    """Handle jog requests."""
+    try:
+        data = await request.json()
+    except ValueError:  # not JSON / not UTF-8
+        return Response(content=_JOG_INVALID_JSON_BODY, media_type='application/json')
+    if not isinstance(data, dict) or not _jog_step(data.get('axis'), data.get('direction'), 'js_endpoint'):
+        return Response(content=_JOG_INVALID_AXIS_BODY, media_type='application/json')
+    return Response(content=_JOG_OK_BODY, media_type='application/json')
 
 # Stores the latest toolpath visualization data for /toolpath-preview
 _pending_viz_data = {}
@@ -303,6 +391,38 @@ def toolpath_preview():
     """Serve latest toolpath visualization data as JSON (avoids embedding in WebSocket message)."""
     return JSONResponse(_pending_viz_data)
 
+# Long-lived worker pool for Packaide nesting — reused across /nest requests
+# instead of spinning up (and tearing down) a fresh pool per call.
+_NEST_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=max(2, (os.cpu_count() or 2) // 2), thread_name_prefix='nest')
+app.on_shutdown(lambda: _NEST_EXECUTOR.shutdown(wait=False))
+
+# Recent successful nest results keyed by a hash of the normalised request,
+# so resubmitting identical shapes/sheet/offset/rotations skips packaide.pack.
+_NEST_CACHE_SIZE = 64
+_nest_cache = collections.OrderedDict()  # key -> result dict (LRU order)
+
+
+def _nest_cache_key(input_shapes, sheet_width, sheet_height, offset, rotations):
+    """Stable hash of a nest request (coordinates rounded to 0.001 mm)."""
+    shapes = [
+        [s.get('name', 'shape'), bool(s.get('closed', True)),
+         [[round(p[0], 3), round(p[1], 3)] for p in (s.get('points') or [])]]
+        for s in input_shapes
+    ]
+    payload = json.dumps({'s': shapes, 'w': sheet_width, 'h': sheet_height,
+                          'o': offset, 'r': rotations}, sort_keys=True)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+@app.post('/nest/cache-clear')
+async def nest_cache_clear():
+    """Drop all memoized nest results."""
+    count = len(_nest_cache)
+    _nest_cache.clear()
+    logger.info(f"[NEST] cache cleared ({count} entries)")
+    return {'status': 'ok', 'cleared': count}
+
 # API endpoint for Packaide nesting
 @app.post('/nest')
 async def nest_endpoint(request: Request):
@@ -315,13 +435,15 @@ async def nest_endpoint(request: Request):
     - offset: number (mm) - spacing between shapes
     - rotations: number - how many rotations to try (1=no rotation, 4=90° increments)
     """
-    import asyncio
-    import concurrent.futures
-    import time
-    
     _t0 = time.monotonic()
+    loop = asyncio.get_event_loop()
     try:
-        data = await request.json()
+        # Large layouts are tens of thousands of floats — parse them on the
+        # nest pool (orjson when available) rather than on the event loop
+        raw = await request.body()
+        data = await loop.run_in_executor(_NEST_EXECUTOR, orjson.loads if orjson else json.loads, raw)
+        if not isinstance(data, dict):
+            return {'status': 'error', 'message': 'Expected a JSON object'}
         
         input_shapes = data.get('shapes', [])
         sheet_width = data.get('sheetWidth', 1720)
@@ -341,14 +463,25 @@ async def nest_endpoint(request: Request):
         if not input_shapes:
             return {'status': 'error', 'message': 'No shapes provided'}
         
-        # Run the CPU-intensive nesting in a thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        cache_key = await loop.run_in_executor(
+            _NEST_EXECUTOR, _nest_cache_key,
+            input_shapes, sheet_width, sheet_height, offset, rotations
+        )
+        result = _nest_cache.get(cache_key)
+        if result is not None:
+            _nest_cache.move_to_end(cache_key)
+            logger.info(f"[NEST] cache hit {cache_key}")
+        else:
+            # Run the CPU-intensive nesting in a thread pool to avoid blocking
             result = await loop.run_in_executor(
-                executor,
+                _NEST_EXECUTOR,
                 run_packaide_nesting,
                 input_shapes, sheet_width, sheet_height, offset, rotations
             )
+            if result.get('status') == 'ok':
+                _nest_cache[cache_key] = result
+                if len(_nest_cache) > _NEST_CACHE_SIZE:
+                    _nest_cache.popitem(last=False)
         
         elapsed = time.monotonic() - _t0
         logger.info(f"[NEST] /nest done in {elapsed:.2f}s status={result.get('status')} "
@@ -360,7 +493,11 @@ async def nest_endpoint(request: Request):
                       placement_count=len(result.get('placements') or []))
         except Exception:
             pass
-        return result
+        # Placements are slotted dataclasses; orjson serialises them natively
+        # and skips FastAPI's jsonable_encoder walk over every point
+        if orjson:
+            return Response(content=orjson.dumps(result), media_type='application/json')
+        return Response(content=json.dumps(result, default=asdict), media_type='application/json')
         
     except Exception as e:
         elapsed = time.monotonic() - _t0
@@ -372,38 +509,62 @@ async def nest_endpoint(request: Request):
         return {'status': 'error', 'message': str(e)}
 
 
+@dataclass(slots=True)
+class _Placement:
+    """One placed shape in a /nest response (field names match the JS side)."""
+    name: str
+    points: list
+    centerX: float
+    centerY: float
+    angle: float
+
+
+# <path ...> tags of a Packaide output sheet (attributes in any order, with or
+# without a namespace prefix) and the two attributes read from each
+_SVG_PATH_TAG_RE = re.compile(r'<(?:[\w.-]+:)?path\b([^>]*)>')
+_SVG_ID_ATTR_RE = re.compile(r'(?:^|\s)id\s*=\s*"([^"]*)"')
+_SVG_TRANSFORM_ATTR_RE = re.compile(r'(?:^|\s)transform\s*=\s*"([^"]*)"')
+
+# translate(...) / rotate(...) entries of a Packaide output transform attribute
+_SVG_TRANSFORM_RE = re.compile(r'(translate|rotate)\(([-\d.,\s]+)\)')
+
+
 def run_packaide_nesting(input_shapes, sheet_width, sheet_height, offset, rotations):
     """Run Packaide nesting in a separate thread to avoid blocking the event loop."""
-    import time
     _t_pack_start = time.monotonic()
     try:
         import packaide
-        from xml.dom import minidom
-        import re
+        from xml.sax.saxutils import unescape
         
         # Store original points by name for later transformation
         original_points = {}
         
-        # Convert shapes to SVG paths
-        svg_paths = []
-        shape_ids = []
+        # Convert shapes to SVG paths, tagged with bounding-box area for ordering
+        entries = []  # (bbox_area, svg_path)
         for shape in input_shapes:
             name = shape.get('name', 'shape')
             points = shape.get('points', [])
             if len(points) < 2:
                 continue
             
-            original_points[name] = points
+            pts = np.asarray(points, dtype=np.float64)
+            original_points[name] = pts
+            w, h = pts.max(axis=0) - pts.min(axis=0)
             
-            # Create SVG path data
-            path_d = f"M {points[0][0]},{points[0][1]}"
-            for pt in points[1:]:
-                path_d += f" L {pt[0]},{pt[1]}"
+            # Create SVG path data (collect parts and join once — repeated
+            # += is quadratic in the vertex count for long polylines)
+            parts = [f"M {points[0][0]},{points[0][1]}"]
+            parts.extend([f"L {pt[0]},{pt[1]}" for pt in points[1:]])
             if shape.get('closed', True):
-                path_d += " Z"
+                parts.append("Z")
+            path_d = " ".join(parts)
             
-            svg_paths.append(f'<path id="{name}" d="{path_d}" />')
-            shape_ids.append(name)
+            entries.append((float(w * h), f'<path id="{name}" d="{path_d}" />'))
+        
+        # Largest first — Packaide places shapes in document order, and
+        # placing big parts first leaves the gaps for the small ones
+        entries.sort(key=lambda e: -e[0])
+        svg_paths = [path for _, path in entries]
         
         if not svg_paths:
             return {'status': 'error', 'message': 'No valid shapes to nest'}
@@ -417,7 +578,7 @@ def run_packaide_nesting(input_shapes, sheet_width, sheet_height, offset, rotati
         sheet_svg = f'''<svg width="{sheet_width}" height="{sheet_height}" viewBox="0 0 {sheet_width} {sheet_height}">
         </svg>'''
         
-        logger.info(f"Nesting {len(shape_ids)} shapes on {sheet_width}x{sheet_height} sheet with offset={offset}, rotations={rotations}")
+        logger.info(f"Nesting {len(svg_paths)} shapes on {sheet_width}x{sheet_height} sheet with offset={offset}, rotations={rotations}")
         
         # Run Packaide
         _t_call = time.monotonic()
@@ -437,17 +598,18 @@ def run_packaide_nesting(input_shapes, sheet_width, sheet_height, offset, rotati
         # Packaide returns SVG with transforms that need to be applied
         placements = []
         if result:
-            from xml.dom import minidom
-            import re
-            
+            # Packaide emits at most `rotations` distinct angles, so the trig
+            # for each is computed once and shared by every shape using it
+            trig_cache = {}  # angle (deg) -> (cos, sin)
             for sheet_idx, out_svg in result:
                 try:
-                    doc = minidom.parseString(out_svg)
-                    paths = doc.getElementsByTagName('path')
-                    
-                    for path in paths:
-                        path_id = path.getAttribute('id')
-                        transform = path.getAttribute('transform')
+                    # Only id and transform of each <path> are needed, so scrape
+                    # them from the text rather than building a DOM tree
+                    for path_attrs in _SVG_PATH_TAG_RE.findall(out_svg):
+                        id_match = _SVG_ID_ATTR_RE.search(path_attrs)
+                        tf_match = _SVG_TRANSFORM_ATTR_RE.search(path_attrs)
+                        path_id = unescape(id_match.group(1), {'&quot;': '"'}) if id_match else ''
+                        transform = tf_match.group(1) if tf_match else ''
                         
                         # Get original points for this shape
                         if path_id not in original_points:
@@ -458,58 +620,48 @@ def run_packaide_nesting(input_shapes, sheet_width, sheet_height, offset, rotati
                         tx, ty, angle = 0, 0, 0
                         rot_cx, rot_cy = 0, 0
                         if transform:
-                            # Parse translate(x, y)
-                            translate_match = re.search(r'translate\(([-\d.]+),\s*([-\d.]+)\)', transform)
-                            if translate_match:
-                                tx = float(translate_match.group(1))
-                                ty = float(translate_match.group(2))
-                            
-                            # Parse rotate(angle, cx, cy) - Packaide uses this format
-                            rotate_match = re.search(r'rotate\(([-\d.]+),\s*([-\d.]+),\s*([-\d.]+)\)', transform)
-                            if rotate_match:
-                                angle = float(rotate_match.group(1))
-                                rot_cx = float(rotate_match.group(2))
-                                rot_cy = float(rotate_match.group(3))
+                            # translate(x, y) and rotate(angle, cx, cy) - Packaide uses
+                            # these formats; one pass over the attribute picks up both
+                            seen = set()
+                            for op, args in _SVG_TRANSFORM_RE.findall(transform):
+                                if op in seen:
+                                    continue
+                                vals = args.split(',')
+                                if op == 'translate' and len(vals) == 2:
+                                    tx, ty = map(float, vals)
+                                    seen.add(op)
+                                elif op == 'rotate' and len(vals) == 3:
+                                    angle, rot_cx, rot_cy = map(float, vals)
+                                    seen.add(op)
                         
-                        # Apply transformation to original points
+                        # Apply transformation to original points (whole array at once)
                         # Transform order: translate, then rotate around (rot_cx, rot_cy)
-                        transformed_points = []
-                        rad = math.radians(angle)
-                        cos_a = math.cos(rad)
-                        sin_a = math.sin(rad)
+                        transformed = orig_pts + (tx, ty)
+                        if angle % 360.0 != 0.0:  # a full turn is a pure translation
+                            # Rotation center is relative to translated origin
+                            trig = trig_cache.get(angle)
+                            if trig is None:
+                                rad = math.radians(angle)
+                                trig = trig_cache[angle] = (math.cos(rad), math.sin(rad))
+                            cos_a, sin_a = trig
+                            rot = np.array([[cos_a, -sin_a], [sin_a, cos_a]])
+                            center = np.array([tx + rot_cx, ty + rot_cy])
+                            transformed = (transformed - center) @ rot.T + center
                         
-                        for px, py in orig_pts:
-                            # First translate
-                            x = px + tx
-                            y = py + ty
-                            
-                            # Then rotate around center (rot_cx, rot_cy) relative to translated position
-                            if angle != 0:
-                                # Rotation center is relative to translated origin
-                                cx = tx + rot_cx
-                                cy = ty + rot_cy
-                                # Rotate point around center
-                                dx = x - cx
-                                dy = y - cy
-                                x = cx + dx * cos_a - dy * sin_a
-                                y = cy + dx * sin_a + dy * cos_a
-                            
-                            transformed_points.append([x, y])
-                        
-                        if transformed_points:
+                        if len(transformed):
                             # Calculate bounding box center
-                            xs = [p[0] for p in transformed_points]
-                            ys = [p[1] for p in transformed_points]
-                            center_x = (min(xs) + max(xs)) / 2
-                            center_y = (min(ys) + max(ys)) / 2
+                            (x_min, y_min), (x_max, y_max) = transformed.min(axis=0), transformed.max(axis=0)
+                            center_x = float(x_min + x_max) / 2
+                            center_y = float(y_min + y_max) / 2
+                            transformed_points = transformed.tolist()
                             
-                            placements.append({
-                                'name': path_id,
-                                'points': transformed_points,
-                                'centerX': center_x,
-                                'centerY': center_y,
-                                'angle': angle
-                            })
+                            placements.append(_Placement(
+                                name=path_id,
+                                points=transformed_points,
+                                centerX=center_x,
+                                centerY=center_y,
+                                angle=angle,
+                            ))
                 except Exception as e:
                     logger.error(f"Error parsing Packaide output: {e}")
         
@@ -526,9 +678,9 @@ def run_packaide_nesting(input_shapes, sheet_width, sheet_height, offset, rotati
         logger.error(f"Nesting error: {e}")
         return {'status': 'error', 'message': str(e)}
 
-# Current loaded G-code
-current_gcode = []
-
+# Current loaded G-code, kept as the single string the generator returned.
+# Lines are only materialised when a job is actually streamed.
+current_gcode = ''
 
 def check_for_updates():
     """Fetch origin and return True if new commits are available on main."""
@@ -569,10 +721,10 @@ def create_header():
         
         # Center: Status pill + time estimate
         with ui.row().classes('items-center justify-center').style('flex: 1; min-width: 0;'):
-            status_pill = ui.element('div').classes('flex items-center gap-2 px-3 py-1 rounded-full').style('background: #2d4a2d; border: 1px solid #3d5a3d;')
+            status_pill = ui.element('div').classes('flex items-center gap-2 px-3 py-1 rounded-full status-pill status-pill--idle')
             with status_pill:
-                status_icon = ui.icon('radio_button_checked', size='10px').classes('text-green-4')
-                status_label = ui.label('Idle').classes('text-caption font-bold text-green-4')
+                status_icon = ui.icon('radio_button_checked', size='10px')
+                status_label = ui.label('Idle').classes('text-caption font-bold').props('data-ui-state=status')
         
         # Right side: Position display + Update button + Version
         with ui.row().classes('items-center gap-2').style('flex-shrink: 0; overflow-x: auto;'):
@@ -580,7 +732,7 @@ def create_header():
                 with ui.element('div').classes('flex items-center gap-1 px-2 py-1 rounded').style('background: #3a3a3a; border: 1px solid #4a4a4a;'):
                     ui.label(f'{axis}').classes('text-caption font-bold').style('color: #888; width: 12px;')
                     unit = '°' if axis == 'A' else ''
-                    pos_labels[axis] = ui.label(f'0.00{unit}').classes('text-body2 font-bold').style('min-width: 65px;')
+                    pos_labels[axis] = ui.label(f'0.00{unit}').classes('text-body2 font-bold').style('min-width: 65px;').props(f'data-ui-state=pos{axis}')
             
             update_btn = ui.button('Software Up To Date', icon='check_circle') \
                 .props('dense flat no-caps color=grey-6') \
@@ -591,31 +743,72 @@ def create_header():
     return pos_labels, status_label, tabs, job_tab, gcode_tab, wifi_tab, update_btn, status_pill, status_icon
 
 
+@functools.lru_cache(maxsize=None)
+def _make_jog(axis: str, distance: float):
+    """Return a shared click handler that jogs `axis` by `distance`.
+
+    Cached so every page build reuses the same function object per button
+    instead of allocating a fresh lambda each time.
+    """
+    def _jog():
+        return jog_axis(axis, distance)  # coroutine — NiceGUI awaits it
+    return _jog
+
+
+# Shared inline styles for the control panels, built once at import rather
+# than per button on every page build. Templates take a colour (and size).
+_PANEL_HEADER_STYLE = ('color: #aaa; background-color: #2a2a2a; padding: 6px 10px; border-radius: 4px; '
+                       'height: 48px; display: flex; align-items: center; justify-content: center; box-sizing: border-box;')
+_FIELD_LABEL_STYLE = 'color: #aaa; font-size: 13px;'
+_STEP_BTN_STYLE = 'background: #2a2a2a; color: {color}; font-size: 14px; width: 44px; height: 44px;'
+_AXIS_LABEL_STYLE = ('color: {color}; font-size: 15px; width: 44px; height: 44px; text-align: center; font-weight: bold; '
+                     'display: flex; align-items: center; justify-content: center;')
+_WIDE_BTN_STYLE = 'background: #2a2a2a; color: {color}; font-size: {size}px; width: 236px; height: 36px; margin-top: 4px;'
+_HOMING_BTN_STYLE = 'font-size: 18px; padding: 12px 16px'
+_FILE_BTN_STYLE = 'flex: 1; background-color: #2a2a2a; font-size: 12px; color: #4a9eff;'
+_JOB_BTN_STYLE = 'font-size: 14px; background-color: #2a2a2a; color: {color};'
+_JOB_HALF_BTN_STYLE = ('font-size: 13px; background-color: #2a2a2a; color: #4a9eff; height: 36px; '
+                       'white-space: nowrap; overflow: hidden;')
+
+
+# Jog panel styles, formatted once rather than on every page build
+_HOME_BTN_STYLE = 'color: #4caf50; font-size: 22px; width: 54px; height: 54px;'
+_Z_LABEL_STYLE = _AXIS_LABEL_STYLE.format(color='#4caf50')
+_A_LABEL_STYLE = _AXIS_LABEL_STYLE.format(color='#ff9800')
+_XY_ZERO_BTN_STYLE = _WIDE_BTN_STYLE.format(color='#4a9eff', size=14)
+_TAPE_BTN_STYLE = _WIDE_BTN_STYLE.format(color='#ce93d8', size=13)
+_WHEEL_BTN_STYLE = _WIDE_BTN_STYLE.format(color='#FFB300', size=13)
+
+
+@functools.lru_cache(maxsize=None)
+def _step_btn_style(color: str) -> str:
+    return _STEP_BTN_STYLE.format(color=color)
+
+
+@functools.lru_cache(maxsize=None)
+def _job_btn_style(color: str) -> str:
+    return _JOB_BTN_STYLE.format(color=color)
+
+
+def _step_jog_button(axis: str, distance: float, label: str, color: str):
+    """One square Z/A step button, enabled only while idle."""
+    return ui.button(label, on_click=_make_jog(axis, distance)).props('flat dense') \
+        .style(_step_btn_style(color)) \
+        .bind_enabled_from(machine_state.flags, 'idle')
+
+
+def _on_jog_event(e):
+    return jog_axis(e.args['axis'], e.args['distance'])
+
+
+def _zero_xy():
+    cnc_controller.send_command("G92 X0 Y0")
+
+
+
 def create_jog_controls():
     """Create jog controls with circular wheel design like Bambu Studio."""
     
-    # Add CSS for SVG hover effects and round home button
-    ui.add_head_html('''
-    <style>
-    .jog-segment {
-        cursor: pointer;
-        transition: fill 0.15s ease;
-    }
-    .jog-segment:hover {
-        fill: #4a5a4a !important;
-    }
-    .jog-segment:active {
-        fill: #5a6a5a !important;
-    }
-    .home-btn {
-        border-radius: 50% !important;
-    }
-    .home-btn:hover {
-        background: #4a5a4a !important;
-    }
-    </style>
-    ''')
-    
     # Main container - inline layout for toolpath panel
     with ui.column().classes('items-center gap-2'):
         
@@ -625,288 +818,51 @@ def create_jog_controls():
             # Center at 154,154 (scaled 10% from 140). Equal width rings:
             # Home button: r=31, Inner: r=31-70, Middle: r=70-110, Outer: r=110-151
             # Each ring ~40px wide for equal visible thickness
-            with ui.element('div').classes('jog-wheel').style('''
-                position: relative;
-                width: 308px;
-                height: 308px;
-            '''):
+            with ui.element('div').classes('jog-wheel'):
                 # Create SVG wheel with proper arc segments
-                wheel_svg = ui.element('div').style('position: absolute; top: 0; left: 0;')
-                
-                # SVG paths for each segment - 3 equal-width rings per quadrant (scaled 10%)
-                # Outer ring: 100mm (r=151 to r=110)
-                # Middle ring: 10mm (r=110 to r=70)
-                # Inner ring: 1mm (r=70 to r=31)
-                # Home button: r=31
-                # Diagonal points at 45°: r*0.707
-                # r=151: 106.8 -> (260.8, 47.2)
-                # r=110: 77.8 -> (231.8, 76.2)
-                # r=70: 49.5 -> (203.5, 104.5)
-                # r=31: 21.9 -> (175.9, 132.1)
+                ui.element('div').classes('jog-wheel-svg')
                 
-                svg_content = '''
-                    <svg width="308" height="308" viewBox="0 0 308 308">
-                        <!-- Background circle -->
-                        <circle cx="154" cy="154" r="152" fill="#2a2a2a" stroke="#4a4a4a" stroke-width="2"/>
-                        
-                        <!-- Y+ OUTER (top, +100) -->
-                        <path id="y-plus-100" class="jog-segment" fill="#3a3a3a"
-                            d="M 154 3
-                               A 151 151 0 0 1 260.8 47.2
-                               L 231.8 76.2
-                               A 110 110 0 0 0 154 44
-                               A 110 110 0 0 0 76.2 76.2
-                               L 47.2 47.2
-                               A 151 151 0 0 1 154 3
-                               Z"/>
-                        
-                        <!-- Y+ MIDDLE (top, +10) -->
-                        <path id="y-plus-10" class="jog-segment" fill="#353535"
-                            d="M 154 44
-                               A 110 110 0 0 1 231.8 76.2
-                               L 203.5 104.5
-                               A 70 70 0 0 0 154 84
-                               A 70 70 0 0 0 104.5 104.5
-                               L 76.2 76.2
-                               A 110 110 0 0 1 154 44
-                               Z"/>
-                        
-                        <!-- Y+ INNER (top, +1) -->
-                        <path id="y-plus-1" class="jog-segment" fill="#303030"
-                            d="M 154 84
-                               A 70 70 0 0 1 203.5 104.5
-                               L 175.9 132.1
-                               A 31 31 0 0 0 154 123
-                               A 31 31 0 0 0 132.1 132.1
-                               L 104.5 104.5
-                               A 70 70 0 0 1 154 84
-                               Z"/>
-                        
-                        <!-- X+ OUTER (right, +100) -->
-                        <path id="x-plus-100" class="jog-segment" fill="#3a3a3a"
-                            d="M 305 154
-                               A 151 151 0 0 1 260.8 260.8
-                               L 231.8 231.8
-                               A 110 110 0 0 0 264 154
-                               A 110 110 0 0 0 231.8 76.2
-                               L 260.8 47.2
-                               A 151 151 0 0 1 305 154
-                               Z"/>
-                        
-                        <!-- X+ MIDDLE (right, +10) -->
-                        <path id="x-plus-10" class="jog-segment" fill="#353535"
-                            d="M 264 154
-                               A 110 110 0 0 1 231.8 231.8
-                               L 203.5 203.5
-                               A 70 70 0 0 0 224 154
-                               A 70 70 0 0 0 203.5 104.5
-                               L 231.8 76.2
-                               A 110 110 0 0 1 264 154
-                               Z"/>
-                        
-                        <!-- X+ INNER (right, +1) -->
-                        <path id="x-plus-1" class="jog-segment" fill="#303030"
-                            d="M 224 154
-                               A 70 70 0 0 1 203.5 203.5
-                               L 175.9 175.9
-                               A 31 31 0 0 0 185 154
-                               A 31 31 0 0 0 175.9 132.1
-                               L 203.5 104.5
-                               A 70 70 0 0 1 224 154
-                               Z"/>
-                        
-                        <!-- Y- OUTER (bottom, -100) -->
-                        <path id="y-minus-100" class="jog-segment" fill="#3a3a3a"
-                            d="M 154 305
-                               A 151 151 0 0 1 47.2 260.8
-                               L 76.2 231.8
-                               A 110 110 0 0 0 154 264
-                               A 110 110 0 0 0 231.8 231.8
-                               L 260.8 260.8
-                               A 151 151 0 0 1 154 305
-                               Z"/>
-                        
-                        <!-- Y- MIDDLE (bottom, -10) -->
-                        <path id="y-minus-10" class="jog-segment" fill="#353535"
-                            d="M 154 264
-                               A 110 110 0 0 1 76.2 231.8
-                               L 104.5 203.5
-                               A 70 70 0 0 0 154 224
-                               A 70 70 0 0 0 203.5 203.5
-                               L 231.8 231.8
-                               A 110 110 0 0 1 154 264
-                               Z"/>
-                        
-                        <!-- Y- INNER (bottom, -1) -->
-                        <path id="y-minus-1" class="jog-segment" fill="#303030"
-                            d="M 154 224
-                               A 70 70 0 0 1 104.5 203.5
-                               L 132.1 175.9
-                               A 31 31 0 0 0 154 185
-                               A 31 31 0 0 0 175.9 175.9
-                               L 203.5 203.5
-                               A 70 70 0 0 1 154 224
-                               Z"/>
-                        
-                        <!-- X- OUTER (left, -100) -->
-                        <path id="x-minus-100" class="jog-segment" fill="#3a3a3a"
-                            d="M 3 154
-                               A 151 151 0 0 1 47.2 47.2
-                               L 76.2 76.2
-                               A 110 110 0 0 0 44 154
-                               A 110 110 0 0 0 76.2 231.8
-                               L 47.2 260.8
-                               A 151 151 0 0 1 3 154
-                               Z"/>
-                        
-                        <!-- X- MIDDLE (left, -10) -->
-                        <path id="x-minus-10" class="jog-segment" fill="#353535"
-                            d="M 44 154
-                               A 110 110 0 0 1 76.2 76.2
-                               L 104.5 104.5
-                               A 70 70 0 0 0 84 154
-                               A 70 70 0 0 0 104.5 203.5
-                               L 76.2 231.8
-                               A 110 110 0 0 1 44 154
-                               Z"/>
-                        
-                        <!-- X- INNER (left, -1) -->
-                        <path id="x-minus-1" class="jog-segment" fill="#303030"
-                            d="M 84 154
-                               A 70 70 0 0 1 104.5 104.5
-                               L 132.1 132.1
-                               A 31 31 0 0 0 123 154
-                               A 31 31 0 0 0 132.1 175.9
-                               L 104.5 203.5
-                               A 70 70 0 0 1 84 154
-                               Z"/>
-                        
-                        <!-- Dividing lines -->
-                        <line x1="47.2" y1="47.2" x2="260.8" y2="260.8" stroke="#4a4a4a" stroke-width="1"/>
-                        <line x1="260.8" y1="47.2" x2="47.2" y2="260.8" stroke="#4a4a4a" stroke-width="1"/>
-                        
-                        <!-- Ring dividers -->
-                        <circle cx="154" cy="154" r="110" fill="none" stroke="#4a4a4a" stroke-width="1"/>
-                        <circle cx="154" cy="154" r="70" fill="none" stroke="#4a4a4a" stroke-width="1"/>
-                        
-                        <!-- Center circle background -->
-                        <circle cx="154" cy="154" r="31" fill="#2a2a2a" stroke="#4a4a4a" stroke-width="2"/>
-                        
-                        <!-- Labels along top-right diagonal only -->
-                        <text x="238" y="63" text-anchor="middle" fill="#666" font-size="11">100</text>
-                        <text x="210" y="91" text-anchor="middle" fill="#666" font-size="11">10</text>
-                        <text x="183" y="118" text-anchor="middle" fill="#666" font-size="11">1</text>
-                        
-                        <!-- Axis labels -->
-                        <text x="154" y="20" text-anchor="middle" fill="#9e9e9e" font-size="15" font-weight="bold">Y</text>
-                        <text x="293" y="159" text-anchor="middle" fill="#9e9e9e" font-size="15" font-weight="bold">X</text>
-                        <text x="154" y="301" text-anchor="middle" fill="#9e9e9e" font-size="15" font-weight="bold">-Y</text>
-                        <text x="15" y="159" text-anchor="middle" fill="#9e9e9e" font-size="15" font-weight="bold">-X</text>
-                    </svg>
-                '''
-                
-                wheel_svg._props['innerHTML'] = svg_content
-                
-                # Add click handlers via JavaScript
-                ui.run_javascript('''
-                    // Y+ handlers
-                    document.getElementById('y-plus-100')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'Y', distance: 100});
-                    });
-                    document.getElementById('y-plus-10')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'Y', distance: 10});
-                    });
-                    document.getElementById('y-plus-1')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'Y', distance: 1});
-                    });
-                    // X+ handlers
-                    document.getElementById('x-plus-100')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'X', distance: 100});
-                    });
-                    document.getElementById('x-plus-10')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'X', distance: 10});
-                    });
-                    document.getElementById('x-plus-1')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'X', distance: 1});
-                    });
-                    // Y- handlers
-                    document.getElementById('y-minus-100')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'Y', distance: -100});
-                    });
-                    document.getElementById('y-minus-10')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'Y', distance: -10});
-                    });
-                    document.getElementById('y-minus-1')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'Y', distance: -1});
-                    });
-                    // X- handlers
-                    document.getElementById('x-minus-100')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'X', distance: -100});
-                    });
-                    document.getElementById('x-minus-10')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'X', distance: -10});
-                    });
-                    document.getElementById('x-minus-1')?.addEventListener('click', () => {
-                        emitEvent('jog', {axis: 'X', distance: -1});
-                    });
-                ''')
+                # Wheel SVG and its click handlers are static assets
+                # (static/jog_wheel.svg, static/jog_wheel.js) so the browser
+                # caches them instead of receiving them on every page build
+                ui.run_javascript(f'window.mountJogWheel("{APP_VERSION}")')
                 
                 # Register event handler (jog_axis is async — NiceGUI awaits coroutine results)
-                ui.on('jog', lambda e: jog_axis(e.args['axis'], e.args['distance']))
+                ui.on('jog', _on_jog_event)
                 
                 # Home button in center (r=31, so diameter=62)
-                with ui.element('div').style('''
-                    position: absolute;
-                    width: 58px;
-                    height: 58px;
-                    top: 50%;
-                    left: 50%;
-                    transform: translate(-50%, -50%);
-                    border-radius: 50%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    z-index: 10;
-                '''):
-                    ui.button(icon='home', on_click=home_all).props('flat round').classes('home-btn').style('color: #4caf50; font-size: 22px; width: 54px; height: 54px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
+                with ui.element('div').classes('jog-wheel-home'):
+                    ui.button(icon='home', on_click=home_all).props('flat round').classes('home-btn').style(_HOME_BTN_STYLE) \
+                        .bind_enabled_from(machine_state.flags, 'idle')
             
             # Z/A Step buttons below wheel
             with ui.column().classes('items-center gap-1'):
                 with ui.row().classes('gap-1 items-center'):
-                    ui.button('+10', on_click=lambda: jog_axis('Z', 10)).props('flat dense').style('background: #2a2a2a; color: #4caf50; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
-                    ui.button('+1', on_click=lambda: jog_axis('Z', 1)).props('flat dense').style('background: #2a2a2a; color: #4caf50; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
-                    ui.label('Z').style('color: #4caf50; font-size: 15px; width: 44px; height: 44px; text-align: center; font-weight: bold; display: flex; align-items: center; justify-content: center;')
-                    ui.button('-1', on_click=lambda: jog_axis('Z', -1)).props('flat dense').style('background: #2a2a2a; color: #4caf50; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
-                    ui.button('-10', on_click=lambda: jog_axis('Z', -10)).props('flat dense').style('background: #2a2a2a; color: #4caf50; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
+                    for distance, label in ((10, '+10'), (1, '+1')):
+                        _step_jog_button('Z', distance, label, '#4caf50')
+                    ui.label('Z').style(_Z_LABEL_STYLE)
+                    for distance, label in ((-1, '-1'), (-10, '-10')):
+                        _step_jog_button('Z', distance, label, '#4caf50')
                 
                 # A controls
                 with ui.row().classes('gap-1 items-center'):
-                    ui.button('+90', on_click=lambda: jog_axis('A', 90)).props('flat dense').style('background: #2a2a2a; color: #ff9800; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
-                    ui.button('+45', on_click=lambda: jog_axis('A', 45)).props('flat dense').style('background: #2a2a2a; color: #ff9800; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
-                    ui.label('A').style('color: #ff9800; font-size: 15px; width: 44px; height: 44px; text-align: center; font-weight: bold; display: flex; align-items: center; justify-content: center;')
-                    ui.button('-45', on_click=lambda: jog_axis('A', -45)).props('flat dense').style('background: #2a2a2a; color: #ff9800; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
-                    ui.button('-90', on_click=lambda: jog_axis('A', -90)).props('flat dense').style('background: #2a2a2a; color: #ff9800; font-size: 14px; width: 44px; height: 44px;') \
-                        .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
+                    for distance, label in ((90, '+90'), (45, '+45')):
+                        _step_jog_button('A', distance, label, '#ff9800')
+                    ui.label('A').style(_A_LABEL_STYLE)
+                    for distance, label in ((-45, '-45'), (-90, '-90')):
+                        _step_jog_button('A', distance, label, '#ff9800')
                 
                 # XY Zero button - spans full width (5 * 44px + 4 gaps * 4px = 236px)
-                ui.button('XY Zero', on_click=lambda: cnc_controller.send_command("G92 X0 Y0")).props('flat dense').style('background: #2a2a2a; color: #4a9eff; font-size: 14px; width: 236px; height: 36px; margin-top: 4px;') \
-                    .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
+                ui.button('XY Zero', on_click=_zero_xy).props('flat dense').style(_XY_ZERO_BTN_STYLE) \
+                    .bind_enabled_from(machine_state.flags, 'idle')
 
                 # Tape Fabric button — homes then moves to center of work area
-                ui.button('Tape Fabric', icon='straighten', on_click=tape_fabric).props('flat dense').style('background: #2a2a2a; color: #ce93d8; font-size: 13px; width: 236px; height: 36px; margin-top: 4px;') \
-                    .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
+                ui.button('Tape Fabric', icon='straighten', on_click=tape_fabric).props('flat dense').style(_TAPE_BTN_STYLE) \
+                    .bind_enabled_from(machine_state.flags, 'idle')
 
                 # Change Cutting Wheel button — homes then lowers Z to wheel-change position
-                ui.button('Change Cutting Wheel', icon='build', on_click=change_cutting_wheel).props('flat dense').style('background: #2a2a2a; color: #FFB300; font-size: 13px; width: 236px; height: 36px; margin-top: 4px;') \
-                    .bind_enabled_from(machine_state, '_lock', backward=lambda _: machine_state.is_idle())
+                ui.button('Change Cutting Wheel', icon='build', on_click=change_cutting_wheel).props('flat dense').style(_WHEEL_BTN_STYLE) \
+                    .bind_enabled_from(machine_state.flags, 'idle')
     
 
 
@@ -917,89 +873,66 @@ def create_homing_controls():
         ui.label('Homing').classes('text-h5 font-bold')
         
         with ui.row().classes('gap-2'):
-            ui.button('X', on_click=lambda: home_axis('X')) \
-                .props('size=lg') \
-                .classes('w-20') \
-                .style('font-size: 18px; padding: 12px 16px') \
-                .bind_enabled_from(machine_state, '_lock',
-                                 backward=lambda _: machine_state.is_idle())
-            ui.button('Y', on_click=lambda: home_axis('Y')) \
-                .props('size=lg') \
-                .classes('w-20') \
-                .style('font-size: 18px; padding: 12px 16px') \
-                .bind_enabled_from(machine_state, '_lock',
-                                 backward=lambda _: machine_state.is_idle())
-            ui.button('Z', on_click=lambda: home_axis('Z')) \
-                .props('size=lg') \
-                .classes('w-20') \
-                .style('font-size: 18px; padding: 12px 16px') \
-                .bind_enabled_from(machine_state, '_lock',
-                                 backward=lambda _: machine_state.is_idle())
-            ui.button('A', on_click=lambda: home_axis('A')) \
-                .props('size=lg') \
-                .classes('w-20') \
-                .style('font-size: 18px; padding: 12px 16px') \
-                .bind_enabled_from(machine_state, '_lock',
-                                 backward=lambda _: machine_state.is_idle())
+            for axis in ('X', 'Y', 'Z', 'A'):
+                ui.button(axis, on_click=functools.partial(home_axis, axis)) \
+                    .props('size=lg') \
+                    .classes('w-20') \
+                    .style(_HOMING_BTN_STYLE) \
+                    .bind_enabled_from(machine_state.flags, 'idle')
         
         ui.button('Home All', on_click=home_all, color='primary') \
             .props('size=lg') \
             .classes('w-full') \
-            .style('font-size: 18px; padding: 12px 16px') \
-            .bind_enabled_from(machine_state, '_lock',
-                             backward=lambda _: machine_state.is_idle())
+            .style(_HOMING_BTN_STYLE) \
+            .bind_enabled_from(machine_state.flags, 'idle')
+
+
+# Runs in the browser on clicks inside the DXF uploader: only the upload
+# header/button area, not the file list itself
+_DXF_UPLOAD_CLICK_JS = '''(e) => {
+    if (!e.target.closest('.q-uploader__header') && !e.target.closest('.q-btn')) return;
+    const list = e.target.closest('.dxf-upload').querySelector('.q-uploader__list');
+    if (list) list.innerHTML = '';
+}'''
 
 
 def create_file_controls():
     """Create the compact file upload and management panel."""
     with ui.column().classes('w-full gap-2'):
-        ui.label('Job File').classes('text-body1 font-bold w-full text-center').style('color: #aaa; background-color: #2a2a2a; padding: 6px 10px; border-radius: 4px; height: 48px; display: flex; align-items: center; justify-content: center; box-sizing: border-box;')
+        ui.label('Job File').classes('text-body1 font-bold w-full text-center').style(_PANEL_HEADER_STYLE)
         
         upload = ui.upload(
             label='Load DXF Files',
             auto_upload=True,
             multiple=True,
-            on_upload=lambda e: handle_file_upload(e)
+            on_upload=handle_file_upload
         ).props('accept=.dxf dense multiple').classes('w-full dxf-upload').style('font-size: 13px;')
-        
-        # Use JavaScript to reset on click (before file picker opens)
-        # This clears the old file, then user picks new file which shows up
-        ui.add_head_html('''
-            <script>
-                document.addEventListener('click', function(e) {
-                    // Check if click is on the upload header/button area (not the file list)
-                    const uploader = e.target.closest('.dxf-upload');
-                    if (uploader && (e.target.closest('.q-uploader__header') || e.target.closest('.q-btn'))) {
-                        // Find and clear the file list
-                        const list = uploader.querySelector('.q-uploader__list');
-                        if (list) list.innerHTML = '';
-                    }
-                }, true);
-            </script>
-        ''')
+        # Clear the old file list when the header/button is clicked, before the
+        # picker returns; listens on the uploader only, not on every page click
+        upload.on('click', js_handler=_DXF_UPLOAD_CLICK_JS)
         
         # Save/Load canvas buttons
         with ui.row().classes('w-full gap-1'):
-            ui.button('Save', icon='save', on_click=save_canvas_state).props('dense flat stack').style('flex: 1; background-color: #2a2a2a; font-size: 12px; color: #4a9eff;').tooltip('Save canvas to file')
-            ui.button('Load', icon='folder_open', on_click=load_canvas_state).props('dense flat stack').style('flex: 1; background-color: #2a2a2a; font-size: 12px; color: #4a9eff;').tooltip('Load saved canvas')
-            ui.button('Clear', icon='delete', on_click=clear_canvas).props('dense flat stack').style('flex: 1; background-color: #2a2a2a; font-size: 12px; color: #4a9eff;').tooltip('Clear all shapes')
+            ui.button('Save', icon='save', on_click=save_canvas_state).props('dense flat stack').style(_FILE_BTN_STYLE).tooltip('Save canvas to file')
+            ui.button('Load', icon='folder_open', on_click=load_canvas_state).props('dense flat stack').style(_FILE_BTN_STYLE).tooltip('Load saved canvas')
+            ui.button('Clear', icon='delete', on_click=clear_canvas).props('dense flat stack').style(_FILE_BTN_STYLE).tooltip('Clear all shapes')
 
 
 def create_job_controls():
     """Create the compact job execution control panel."""
     with ui.column().classes('w-full gap-1'):
-        ui.label('Job Control').classes('text-body1 font-bold w-full text-center').style('color: #aaa; background-color: #2a2a2a; padding: 6px 10px; border-radius: 4px; height: 48px; display: flex; align-items: center; justify-content: center; box-sizing: border-box;')
+        ui.label('Job Control').classes('text-body1 font-bold w-full text-center').style(_PANEL_HEADER_STYLE)
         
         # Cut pressure + speed selectors (grid keeps dropdowns aligned)
         with ui.grid(columns='auto 1fr').classes('w-full items-center gap-x-2 gap-y-1'):
-            ui.label('Cut Pressure:').style('color: #aaa; font-size: 13px;')
+            ui.label('Cut Pressure:').style(_FIELD_LABEL_STYLE)
             _pressure_select = ui.select(
                 options=list(PRESSURE_MAP.keys()),
                 value=cut_settings['pressure'],
                 on_change=lambda e: apply_cut_pressure(e.value)
             ).props('dense outlined').classes('w-full').style('font-size: 13px;')
             _pressure_select_ref['el'] = _pressure_select
-            ui.label('Cut Speed:').style('color: #aaa; font-size: 13px;')
+            ui.label('Cut Speed:').style(_FIELD_LABEL_STYLE)
             _speed_select = ui.select(
                 options=list(SPEED_MAP.keys()),
                 value=cut_settings['speed'],
@@ -1011,7 +944,7 @@ def create_job_controls():
         
         # Home Before Toolpath toggle
         with ui.row().classes('w-full items-center justify-between').style('padding: 4px 0;'):
-            ui.label('Home Before Toolpath').style('color: #aaa; font-size: 13px;')
+            ui.label('Home Before Toolpath').style(_FIELD_LABEL_STYLE)
             ui.switch(value=home_before_toolpath['enabled'],
                       on_change=lambda e: home_before_toolpath.update({'enabled': e.value})) \
                 .props('dense color=orange')
@@ -1020,59 +953,74 @@ def create_job_controls():
         toolpath_btn = ui.button('Generate Toolpath', icon='route', on_click=lambda: toggle_toolpath(toolpath_btn)) \
             .props('dense flat') \
             .classes('w-full') \
-            .style('font-size: 14px; background-color: #2a2a2a; color: #66BB6A;')
+            .style(_job_btn_style('#66BB6A'))
 
         ui.button('Outline Job', icon='crop_free', on_click=outline_job) \
             .props('dense flat') \
             .classes('w-full') \
-            .style('font-size: 14px; background-color: #2a2a2a; color: #FFB300;') \
-            .bind_enabled_from(machine_state, '_lock',
-                             backward=lambda _: machine_state.job_loaded and machine_state.is_idle())
+            .style(_job_btn_style('#FFB300')) \
+            .bind_enabled_from(machine_state.flags, 'can_outline')
 
         ui.button('Start', icon='play_arrow', on_click=start_job) \
             .props('dense flat') \
             .classes('w-full') \
-            .style('font-size: 14px; background-color: #2a2a2a; color: #4a9eff;') \
-            .bind_enabled_from(machine_state, '_lock',
-                             backward=lambda _: machine_state.toolpath_generated and machine_state.is_idle())
+            .style(_job_btn_style('#4a9eff')) \
+            .bind_enabled_from(machine_state.flags, 'can_start')
         
         with ui.row().classes('w-full gap-1'):
             ui.button('Pause', icon='pause', on_click=pause_job) \
                 .props('dense flat no-wrap') \
                 .classes('flex-1') \
-                .style('font-size: 13px; background-color: #2a2a2a; color: #4a9eff; height: 36px; white-space: nowrap; overflow: hidden;') \
-                .bind_enabled_from(machine_state, '_lock',
-                                 backward=lambda _: machine_state.is_running())
+                .style(_JOB_HALF_BTN_STYLE) \
+                .bind_enabled_from(machine_state.flags, 'running')
             
             ui.button('Resume', icon='play_arrow', on_click=resume_job) \
                 .props('dense flat no-wrap') \
                 .classes('flex-1') \
-                .style('font-size: 13px; background-color: #2a2a2a; color: #4a9eff; height: 36px; white-space: nowrap; overflow: hidden;') \
-                .bind_enabled_from(machine_state, '_lock',
-                                 backward=lambda _: machine_state.paused)
+                .style(_JOB_HALF_BTN_STYLE) \
+                .bind_enabled_from(machine_state.flags, 'paused')
         
         ui.button('Stop', icon='stop', on_click=stop_job) \
             .props('dense flat') \
             .classes('w-full') \
-            .style('font-size: 14px; background-color: #2a2a2a; color: #4a9eff;') \
-            .bind_enabled_from(machine_state, '_lock',
-                             backward=lambda _: machine_state.busy)
+            .style(_job_btn_style('#4a9eff')) \
+            .bind_enabled_from(machine_state.flags, 'busy')
 
         # Progress bar
         job_progress = ui.linear_progress(value=0, show_value=False).classes('w-full').style('height: 6px; margin-top: 8px;')
-        job_progress.bind_value_from(machine_state, 'job_progress')
+        job_progress.bind_value_from(machine_state.flags, 'job_progress')
 
         return None  # resume button removed — resume is now a popup on reconnect
 
 
 # Event handlers
 
+# Last time each (client, message, type) toast was shown, for _notify
+_notify_last = {}
+
+
+def _notify(message: str, type: str = 'info') -> None:
+    """ui.notify, dropping repeats of the same toast on the same page within 0.5 s.
+
+    Collapses bursts (multi-file uploads, state flapping, repeated clicks)
+    into one toast instead of one websocket message each.
+    """
+    key = (ui.context.client.id, message, type)
+    now = time.monotonic()
+    if now - _notify_last.get(key, 0.0) < 0.5:
+        return
+    if len(_notify_last) > 256:
+        _notify_last.clear()
+    _notify_last[key] = now
+    ui.notify(message, type=type)
+
+
 async def jog_axis(axis: str, distance: float):
     """Handle jog button click."""
     if not await safety_confirm():
         log_event('jog', 'jog_cancelled', axis=axis, distance=distance)
         return
-    print(f"[DEBUG] jog_axis called: axis={axis}, distance={distance}, feed_rate={jog_params['feed_rate']}")
+    logger.debug("jog_axis axis=%s distance=%s feed=%s", axis, distance, jog_params['feed_rate'])
     log_event('jog', 'jog_button', axis=axis, distance=distance, feed_rate=jog_params['feed_rate'])
     cnc_controller.jog(axis, distance, jog_params['feed_rate'])
 
@@ -1200,6 +1148,52 @@ async def change_cutting_wheel():
     ui.notify('Cutting wheel replacement complete!', type='positive')
 
 
+def _bbox(points):
+    """(min_x, min_y, max_x, max_y) of a point list, reduced in NumPy."""
+    arr = np.asarray(points, dtype=np.float64)[:, :2]
+    (min_x, min_y), (max_x, max_y) = arr.min(axis=0).tolist(), arr.max(axis=0).tolist()
+    return min_x, min_y, max_x, max_y
+
+
+# Serialised point JSON per shape, reused when the same shape is re-sent to the
+# canvas (reconnect restore, repeated redraws). Point lists are always replaced
+# rather than mutated in place, so an identity check detects stale entries.
+_shape_json_cache = {}  # name -> (points, points_json)
+
+
+def _compact_json(obj) -> str:
+    """Minified JSON text — orjson when available, else stdlib without padding."""
+    return orjson.dumps(obj).decode() if orjson else json.dumps(obj, separators=(',', ':'))
+
+
+def _points_json(shape_name: str, points) -> str:
+    """Return the JS literal for `points`, memoised per shape name.
+
+    2D point lists go over as a quoted base64 string of little-endian
+    float64 x,y pairs (decoded by addShapes into the usual [[x, y], ...]);
+    anything else falls back to plain JSON.
+    """
+    cached = _shape_json_cache.get(shape_name)
+    if cached is not None and cached[0] is points:
+        return cached[1]
+    arr = np.asarray(points, dtype='<f8')
+    if arr.ndim == 2 and arr.shape[1] == 2:
+        points_json = '"' + base64.b64encode(arr.tobytes()).decode('ascii') + '"'
+    else:
+        points_json = _compact_json(points)
+    _shape_json_cache[shape_name] = (points, points_json)
+    return points_json
+
+
+def _canvas_js(method: str, *args) -> str:
+    """JS source for a window.toolpathCanvas.<method>(...) call.
+
+    Arguments are JSON-encoded, so every call has the same shape and values
+    such as None, booleans and strings always arrive as valid JS literals.
+    """
+    return f'window.toolpathCanvas.{method}({",".join(_compact_json(a) for a in args)})'
+
+
 def add_shapes_to_canvas(shapes: dict, start_color_index: int = 0, breaks: dict = None, entity_types: dict = None):
     """Add shapes to canvas without clearing existing ones."""
     global toolpath_canvas
@@ -1208,23 +1202,30 @@ def add_shapes_to_canvas(shapes: dict, start_color_index: int = 0, breaks: dict
         logger.warning("toolpath_canvas is None, cannot add shapes")
         return
     
-    if shapes:
-        for i, (shape_name, points) in enumerate(shapes.items()):
-            if points:
-                # Log the bounds being sent to JavaScript
-                x_vals = [p[0] for p in points]
-                y_vals = [p[1] for p in points]
-                logger.info(f"  Sending {shape_name} to canvas: {len(points)} pts, X({min(x_vals):.1f}-{max(x_vals):.1f}), Y({min(y_vals):.1f}-{max(y_vals):.1f})")
-                
-                # Convert points, segment breaks and entity types to JSON-safe format
-                points_json = json.dumps(points)
-                seg_breaks = breaks.get(shape_name, [0]) if breaks else [0]
-                breaks_json = json.dumps(seg_breaks)
-                seg_types = entity_types.get(shape_name, []) if entity_types else []
-                types_json = json.dumps(seg_types)
-                ui.run_javascript(f'''try {{ window.toolpathCanvas.addShape("{shape_name}", {points_json}, {start_color_index + i}, {breaks_json}, {types_json}); }} catch(e) {{ alert(e.message); }}''')
-                logger.info(f"  Added {shape_name}: {len(points)} points, {len(seg_breaks)} segments, types={seg_types}")
-
+    if not shapes:
+        return
+    
+    # One JSON payload and one websocket message for the whole batch;
+    # points JSON is spliced in from the per-shape cache
+    entries = []
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for i, (shape_name, points) in enumerate(shapes.items()):
+        if not points:
+            continue
+        seg_breaks = breaks.get(shape_name, [0]) if breaks else [0]
+        seg_types = entity_types.get(shape_name, []) if entity_types else []
+        entries.append(
+            f'[{json.dumps(shape_name)},{_points_json(shape_name, points)},'
+            f'{start_color_index + i},{_compact_json(seg_breaks)},{_compact_json(seg_types)}]')
+        if debug:
+            min_x, min_y, max_x, max_y = _bbox(points)
+            logger.debug(f"  Sending {shape_name} to canvas: {len(points)} pts, X({min_x:.1f}-{max_x:.1f}), Y({min_y:.1f}-{max_y:.1f}), "
+                         f"{len(seg_breaks)} segments, types={seg_types}")
+    if not entries:
+        return
+    payload = '[' + ','.join(entries) + ']'
+    ui.run_javascript(f'''try {{ window.toolpathCanvas.addShapes({payload}); }} catch(e) {{ alert(e.message); }}''')
+    logger.info(f"Added {len(entries)} shapes to canvas")
 
 def update_toolpath_plot(shapes: dict, clear_existing: bool = True):
     """Update the toolpath visualization with new shapes using Fabric.js canvas."""
@@ -1244,40 +1245,60 @@ def update_toolpath_plot(shapes: dict, clear_existing: bool = True):
     add_shapes_to_canvas(shapes)
 
 
+# Recent DXF parse results keyed by (content hash, saved file name,
+# min_distance), so re-uploading an unchanged file skips process_dxf_basic.
+# The name is part of the key because shape names are derived from it.
+_DXF_CACHE_SIZE = 32
+_dxf_cache = collections.OrderedDict()  # key -> (shapes, breaks, types) (LRU order)
+
+
+def _copy_dxf_result(result):
+    """Copy a cached DXF result so callers can't mutate the cached lists."""
+    return tuple({name: list(values) for name, values in d.items()} for d in result)
+
+
 async def handle_file_upload(event):
     """Handle file upload event."""
     global current_gcode, current_toolpath_shapes, toolpath_canvas
     
-    import os
-    import tempfile
-    
     try:
         # NiceGUI UploadEventArguments has a .file attribute containing the SmallFileUpload
         uploaded_file = event.file
         filename = uploaded_file.name
         
-        print(f"\n{'='*60}")
-        print(f"DXF IMPORT DEBUG: {filename}")
-        print(f"{'='*60}")
+        logger.info(f"DXF import: {filename}")
         
-        # SmallFileUpload.read() is async
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.dxf') as tmp:
-            content = await uploaded_file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        # SmallFileUpload.read() is async; the upload is already in memory,
+        # so it is written straight to the uploads directory (no temp file + copy)
+        content = await uploaded_file.read()
         
         # Save to uploads directory
-        saved_path = file_manager.save_uploaded_file(tmp_path, filename)
-        os.unlink(tmp_path)
-        print(f"Saved to: {saved_path}")
+        loop = asyncio.get_event_loop()
+        saved_path = await loop.run_in_executor(None, file_manager.save_uploaded_bytes, content, filename)
+        logger.info(f"Saved to: {saved_path}")
         log_event('file', 'dxf_import_started', filename=filename, saved_path=str(saved_path),
                   size_bytes=len(content))
         
         # Process DXF file
-        ui.notify('Processing DXF file...', type='info')
+        _notify('Processing DXF file...', type='info')
         # min_distance is in inches (DXF units before conversion to mm)
         # 0.1" = 2.54mm spacing - good balance of detail and point count
-        shapes, shape_breaks, shape_types = dxf_processor.process_dxf_basic(saved_path, min_distance=0.1)
+        # Parsed on a worker thread so the event loop (and every page's
+        # websocket) keeps running during large imports
+        cache_key = (hashlib.blake2b(content, digest_size=16).hexdigest(),
+                     os.path.basename(saved_path), 0.1)
+        result = _dxf_cache.get(cache_key)
+        if result is not None:
+            _dxf_cache.move_to_end(cache_key)
+            logger.info(f"DXF cache hit {cache_key[0]}")
+        else:
+            result = await loop.run_in_executor(
+                None, functools.partial(dxf_processor.process_dxf_basic, saved_path, min_distance=0.1))
+            if result[0]:  # a failed parse comes back empty — don't remember it
+                _dxf_cache[cache_key] = result
+                if len(_dxf_cache) > _DXF_CACHE_SIZE:
+                    _dxf_cache.popitem(last=False)
+        shapes, shape_breaks, shape_types = _copy_dxf_result(result)
         current_toolpath_shapes.update(shapes)
         # Persist segment metadata so notch nodes can be regenerated after a
         # browser refresh (otherwise breaks=[0], types=[], and computeCardinalNodes
@@ -1287,35 +1308,23 @@ async def handle_file_upload(event):
         if shape_types:
             current_toolpath_types.update(shape_types)
         
-        # Debug: Print shape details
-        print(f"\n--- DXF Processing Results ---")
-        print(f"Total shapes extracted: {len(shapes)}")
-        
-        for shape_name, points in shapes.items():
-            if not points:
-                print(f"  {shape_name}: EMPTY")
-                continue
-                
-            # Calculate bounds
-            xs = [p[0] for p in points]
-            ys = [p[1] for p in points]
-            min_x, max_x = min(xs), max(xs)
-            min_y, max_y = min(ys), max(ys)
-            width = max_x - min_x
-            height = max_y - min_y
-            
-            # Check if closed
-            first, last = points[0], points[-1]
-            gap = math.sqrt((first[0] - last[0])**2 + (first[1] - last[1])**2)
-            is_closed = gap < 3.81  # 0.15" in mm
-            
-            print(f"\n  {shape_name}:")
-            print(f"    Points: {len(points)}")
-            print(f"    Bounds: X({min_x:.1f} to {max_x:.1f}), Y({min_y:.1f} to {max_y:.1f})")
-            print(f"    Size: {width:.1f}mm x {height:.1f}mm")
-            print(f"    Start: ({first[0]:.2f}, {first[1]:.2f})")
-            print(f"    End: ({last[0]:.2f}, {last[1]:.2f})")
-            print(f"    Gap: {gap:.2f}mm {'(CLOSED)' if is_closed else '(OPEN)'}")
+        # Per-shape details — only formatted when debug logging is on
+        logger.info(f"DXF processing results: {len(shapes)} shapes")
+        if logger.isEnabledFor(logging.DEBUG):
+            for shape_name, points in shapes.items():
+                if not points:
+                    logger.debug(f"  {shape_name}: EMPTY")
+                    continue
+                min_x, min_y, max_x, max_y = _bbox(points)
+                first, last = points[0], points[-1]
+                gap = math.hypot(first[0] - last[0], first[1] - last[1])
+                is_closed = gap < 3.81  # 0.15" in mm
+                logger.debug(
+                    f"  {shape_name}: {len(points)} pts, "
+                    f"X({min_x:.1f} to {max_x:.1f}), Y({min_y:.1f} to {max_y:.1f}), "
+                    f"size {max_x - min_x:.1f}mm x {max_y - min_y:.1f}mm, "
+                    f"start ({first[0]:.2f}, {first[1]:.2f}), end ({last[0]:.2f}, {last[1]:.2f}), "
+                    f"gap {gap:.2f}mm {'(CLOSED)' if is_closed else '(OPEN)'}")
         
         # Update visualization without clearing existing shapes
         # This allows importing multiple DXF files
@@ -1326,22 +1335,65 @@ async def handle_file_upload(event):
         machine_state.set_job_loaded(True, filename)
         machine_state.set_toolpath_generated(False)
         
-        ui.notify(f'File loaded: {filename} ({len(shapes)} shapes)', type='positive')
+        _notify(f'File loaded: {filename} ({len(shapes)} shapes)', type='positive')
         log_event('file', 'dxf_import_complete', filename=filename, shape_count=len(shapes),
                   shape_names=list(shapes.keys()))
     except Exception as e:
-        ui.notify(f'Error processing DXF: {str(e)}', type='negative')
+        _notify(f'Error processing DXF: {str(e)}', type='negative')
         log_event('file', 'dxf_import_error', filename=locals().get('filename'), error=str(e))
         import traceback
         traceback.print_exc()
 
 
+# Characters dropped from user-entered canvas names: anything but letters,
+# digits, '-', '_' and spaces
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\- ]')
+
+
+def _list_saved_canvases(directory, limit: int = 50) -> list:
+    """(path, mtime) of saved canvas JSON files in `directory`, most recent first.
+
+    One scandir pass: each entry's stat is fetched once and reused for both
+    the sort key and the timestamp shown in the save/load dialogs.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = [(e.stat().st_mtime, e.path) for e in it
+                       if e.name.endswith('.json') and e.is_file()]
+    except FileNotFoundError:
+        return []
+    entries.sort(reverse=True)
+    return [(path, mtime) for mtime, path in entries[:limit]]
+
+
+def _write_canvas_file(filepath: str, canvas_json: str, settings: dict) -> int:
+    """Merge cut settings into a canvas JSON string and write it to `filepath`.
+
+    Runs on a worker thread; returns the number of shapes saved.
+    """
+    state = json.loads(canvas_json)
+    state['cut_settings'] = settings
+    if orjson:
+        data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(state, indent=2).encode()
+    with open(filepath, 'wb') as f:
+        f.write(data)
+    return len(state.get('shapes', {}))
+
+
+def _read_canvas_file(filepath: str):
+    """Read and parse a saved canvas file on a worker thread; returns (text, state)."""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    state = orjson.loads(data) if orjson else json.loads(data)
+    return data.decode('utf-8'), state
+
+
 async def save_canvas_state():
     """Save current canvas state — shows all existing canvases with overwrite, download, and delete options."""
-    import glob
-
-    pattern = os.path.join(file_manager.upload_dir, '*.json')
-    files = sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True)
+    loop = asyncio.get_event_loop()
+    files = await loop.run_in_executor(None, _list_saved_canvases, file_manager.upload_dir)
 
     overwrite_confirmed = {'value': False}
     save_btn_ref = {}
@@ -1357,13 +1409,10 @@ async def save_canvas_state():
             with ui.column().classes('w-full gap-0').style(
                 'max-height: 260px; overflow-y: auto; border: 1px solid #333; border-radius: 4px;'
             ):
-                for filepath in files[:50]:
+                for filepath, file_mtime in files:
                     filename = os.path.basename(filepath)
-                    stem = filename[:-5] if filename.endswith('.json') else filename
-                    try:
-                        mtime = datetime.fromtimestamp(os.path.getmtime(filepath)).strftime('%m/%d %H:%M')
-                    except Exception:
-                        mtime = ''
+                    stem = filename[:-5]
+                    mtime = datetime.fromtimestamp(file_mtime).strftime('%m/%d %H:%M')
 
                     def _fill(s=stem):
                         name_input.set_value(s)
@@ -1417,16 +1466,13 @@ async def save_canvas_state():
                     ui.notify('Please enter a filename', type='warning')
                     return
 
-                safe_name = ''.join(c if c.isalnum() or c in '-_ ' else '' for c in name).strip()
-                safe_name = safe_name.replace(' ', '_')
+                safe_name = _UNSAFE_FILENAME_RE.sub('', name).strip().replace(' ', '_')
                 if not safe_name:
                     ui.notify('Invalid filename', type='warning')
                     return
 
-                if not safe_name.endswith('.json'):
-                    safe_name = safe_name[:250] + '.json'
-                else:
-                    safe_name = safe_name[:255]
+                # '.' is stripped above, so the name never already ends in .json
+                safe_name = safe_name[:250] + '.json'
 
                 filepath = os.path.join(file_manager.upload_dir, safe_name)
 
@@ -1445,17 +1491,14 @@ async def save_canvas_state():
                     dialog.close()
                     return
 
-                state = json.loads(canvas_json)
-                state['cut_settings'] = cut_settings.copy()
-                canvas_json = json.dumps(state, indent=2)
-
-                with open(filepath, 'w') as f:
-                    f.write(canvas_json)
+                # Parse, re-encode and write off the event loop
+                shape_count = await loop.run_in_executor(
+                    None, _write_canvas_file, filepath, canvas_json, cut_settings.copy())
 
                 ui.notify(f'Saved: {safe_name}', type='positive')
                 logger.info(f'Canvas state saved to {filepath}')
                 log_event('canvas', 'canvas_saved', filename=safe_name,
-                          shape_count=len(state.get('shapes', {})),
+                          shape_count=shape_count,
                           cut_settings=cut_settings.copy())
                 dialog.close()
 
@@ -1473,11 +1516,9 @@ async def save_canvas_state():
 
 async def load_canvas_state():
     """Show dialog to load a saved canvas state."""
-    import glob
-    
-    # Find all saved canvas JSON files
-    pattern = os.path.join(file_manager.upload_dir, '*.json')
-    files = sorted(glob.glob(pattern), key=os.path.getmtime, reverse=True)  # Most recent first
+    # Find saved canvas JSON files off the event loop
+    loop = asyncio.get_event_loop()
+    files = await loop.run_in_executor(None, _list_saved_canvases, file_manager.upload_dir)
     
     if not files:
         ui.notify('No saved canvases found', type='warning')
@@ -1490,13 +1531,10 @@ async def load_canvas_state():
         with ui.column().classes('w-full gap-0').style(
             'max-height: 400px; overflow-y: auto; border: 1px solid #333; border-radius: 4px;'
         ):
-            for filepath in files[:50]:
+            for filepath, file_mtime in files:
                 filename = os.path.basename(filepath)
-                stem = filename[:-5] if filename.endswith('.json') else filename
-                try:
-                    mtime = datetime.fromtimestamp(os.path.getmtime(filepath)).strftime('%m/%d %H:%M')
-                except Exception:
-                    mtime = ''
+                stem = filename[:-5]
+                mtime = datetime.fromtimestamp(file_mtime).strftime('%m/%d %H:%M')
 
                 def _download(fp=filepath):
                     safe = Path(fp).name
@@ -1510,18 +1548,16 @@ async def load_canvas_state():
                 async def _load(fp=filepath):
                     global current_toolpath_shapes, current_toolpath_breaks, current_toolpath_types, current_toolpath_notches
                     try:
-                        with open(fp, 'r') as f:
-                            canvas_json = f.read()
+                        canvas_json, state = await loop.run_in_executor(None, _read_canvas_file, fp)
                         await ui.run_javascript(
-                            f'window.toolpathCanvas.loadCanvasState({repr(canvas_json)})', timeout=15.0
+                            _canvas_js('loadCanvasState', canvas_json), timeout=15.0
                         )
-                        state = json.loads(canvas_json)
                         current_toolpath_shapes = {}
                         current_toolpath_breaks = {}
                         current_toolpath_types = {}
                         current_toolpath_notches = {}
                         for name, shape_data in state.get('shapes', {}).items():
-                            current_toolpath_shapes[name] = [tuple(p) for p in shape_data.get('points', [])]
+                            current_toolpath_shapes[name] = list(map(tuple, shape_data.get('points', [])))
                             current_toolpath_breaks[name] = list(shape_data.get('segmentBreaks', [0]) or [0])
                             current_toolpath_types[name] = list(shape_data.get('segmentTypes', []) or [])
                         for name, notches in (state.get('notches') or {}).items():
@@ -1584,14 +1620,44 @@ def clear_canvas():
     current_toolpath_breaks = {}
     current_toolpath_types = {}
     current_toolpath_notches = {}
+    _shape_json_cache.clear()
     ui.run_javascript('window.toolpathCanvas.clearShapes()')
     machine_state.set_job_loaded(False)
     machine_state.set_toolpath_generated(False)
     ui.notify('Canvas cleared', type='info')
 
 
+# Set while a toggle is in flight. Generation awaits the canvas and a worker
+# thread for up to several seconds; clicks in that window (from any page) wait
+# for it and then only the last one is applied, and only if the state it asked
+# for isn't already the result, so they coalesce instead of queueing more runs.
+_toolpath_toggle = {'running': False, 'seq': 0, 'done': asyncio.Event()}
+
+
 async def toggle_toolpath(button):
     """Toggle between Generate Toolpath and Clear Toolpath modes."""
+    generate = not machine_state.toolpath_generated  # what this click asked for
+    _toolpath_toggle['seq'] += 1
+    seq = _toolpath_toggle['seq']
+    if _toolpath_toggle['running']:
+        _notify('Toolpath generation already in progress', type='warning')
+        while _toolpath_toggle['running']:
+            await _toolpath_toggle['done'].wait()
+        if seq != _toolpath_toggle['seq']:
+            return  # a later click supersedes this one
+        if machine_state.toolpath_generated == generate:
+            return  # the run that just finished already did what was asked
+    _toolpath_toggle['running'] = True
+    _toolpath_toggle['done'].clear()
+    try:
+        await _toggle_toolpath(button)
+    finally:
+        _toolpath_toggle['running'] = False
+        _toolpath_toggle['done'].set()
+
+
+async def _toggle_toolpath(button):
+    """Clear the previewed toolpath, or fetch canvas state and generate one."""
     global current_gcode
     
     if machine_state.toolpath_generated:
@@ -1600,8 +1666,8 @@ async def toggle_toolpath(button):
         machine_state.set_toolpath_generated(False)
         button.props('icon=route')
         button.set_text('Generate Toolpath')
-        button.style('font-size: 14px; background-color: #2a2a2a; color: #66BB6A;')
-        current_gcode = []
+        button.style(_job_btn_style('#66BB6A'))
+        current_gcode = ''
         log_event('toolpath', 'toolpath_cleared')
         ui.notify('Toolpath cleared - shapes are now editable', type='info')
     else:
@@ -1613,31 +1679,26 @@ async def toggle_toolpath(button):
         ui.notify('Generating toolpath...', type='info')
         
         # Fetch current shape positions from JavaScript canvas (in case shapes were moved)
-        print("=== FETCHING POSITIONS FROM CANVAS ===")
         try:
             positions_json = await ui.run_javascript('JSON.stringify(window.toolpathCanvas.getPositions())', timeout=10.0)
-            print(f"positions_json type: {type(positions_json)}, value: {str(positions_json)[:200] if positions_json else 'None'}")
             if positions_json:
                 positions = json.loads(positions_json)
-                print(f"Canvas shapes: {list(positions.keys())}")
-                print(f"Python shapes before update: {list(current_toolpath_shapes.keys())}")
                 # Replace ALL shapes with canvas positions
                 current_toolpath_shapes.clear()
                 for name, points in positions.items():
-                    current_toolpath_shapes[name] = [tuple(p) for p in points]
-                    print(f"  Added '{name}' with {len(points)} points")
-                print(f"Python shapes after update: {list(current_toolpath_shapes.keys())}")
+                    current_toolpath_shapes[name] = list(map(tuple, points))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Canvas positions: " + ", ".join(
+                        f"{name} ({len(points)} pts)" for name, points in positions.items()))
         except Exception as e:
-            print(f"ERROR fetching positions: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"Error fetching positions from canvas: {e}")
 
         # Warn (dismissible) if any shapes overlap so the user doesn't cut into
         # already-cut material or stack the blade on top of another piece.
         try:
             overlapping_pairs = find_overlapping_pairs(current_toolpath_shapes)
         except Exception as e:
-            print(f"Overlap detection failed: {e}")
+            logger.warning(f"Overlap detection failed: {e}")
             overlapping_pairs = []
         if overlapping_pairs:
             log_event('toolpath', 'overlap_warning_shown',
@@ -1663,26 +1724,24 @@ async def toggle_toolpath(button):
                 notches = json.loads(notches_json)
                 total_notches = sum(len(v) for v in notches.values())
                 if total_notches:
-                    print(f"Fetched {total_notches} notch(es) from canvas")
+                    logger.debug(f"Fetched {total_notches} notch(es) from canvas")
         except Exception as e:
-            print(f"Could not fetch notches: {e}")
+            logger.warning(f"Could not fetch notches: {e}")
         
         # Generate visualization data for the canvas
         # Run CPU-intensive toolpath generation off the asyncio event loop to avoid
         # blocking Socket.IO keepalives (which would cause the client to disconnect).
         loop = asyncio.get_event_loop()
-        import concurrent.futures as _cf
         shapes_snapshot = dict(current_toolpath_shapes)
         notches_snapshot = dict(notches)
-        with _cf.ThreadPoolExecutor(max_workers=1) as _exec:
-            viz_data, gcode_str = await loop.run_in_executor(
-                _exec,
-                lambda: (
-                    toolpath_generator.generate_visualization_data(shapes_snapshot),
-                    toolpath_generator.generate_toolpath(shapes_snapshot, source_filename="preview", notches=notches_snapshot)
-                )
+        viz_data, gcode_str = await loop.run_in_executor(
+            None,
+            lambda: (
+                toolpath_generator.generate_visualization_data(shapes_snapshot),
+                toolpath_generator.generate_toolpath(shapes_snapshot, source_filename="preview", notches=notches_snapshot)
             )
-        current_gcode = gcode_str.split('\n')
+        )
+        current_gcode = gcode_str
 
         # Store viz data server-side; JS fetches it via GET /toolpath-preview so we
         # avoid embedding (potentially megabytes of) JSON inline in the WebSocket message.
@@ -1702,14 +1761,14 @@ async def toggle_toolpath(button):
         machine_state.set_toolpath_generated(True)
         button.props('icon=close')
         button.set_text('Clear Toolpath')
-        button.style('font-size: 14px; background-color: #2a2a2a; color: #FF6600;')
+        button.style(_job_btn_style('#FF6600'))
         
         log_toolpath('toolpath_generated',
                      shape_count=len(current_toolpath_shapes),
                      shape_names=list(current_toolpath_shapes.keys()),
                      segments=total_segments,
                      corners=total_corners,
-                     gcode_lines=len(current_gcode),
+                     gcode_lines=current_gcode.count('\n') + 1,
                      z_cut_height=z_cut_height['value'],
                      cut_settings=cut_settings.copy(),
                      notch_count=sum(len(v) for v in notches.values()) if notches else 0,
@@ -1800,19 +1859,20 @@ async def outline_job():
         if positions_json:
             positions = json.loads(positions_json)
             if positions:
-                current_toolpath_shapes = {name: [tuple(p) for p in pts] for name, pts in positions.items()}
+                current_toolpath_shapes = {name: list(map(tuple, pts)) for name, pts in positions.items()}
     except Exception as e:
         logger.warning(f'Could not fetch canvas positions for outline: {e}')
 
-    # Compute bounding box across all shapes
-    all_x = [p[0] for pts in current_toolpath_shapes.values() for p in pts]
-    all_y = [p[1] for pts in current_toolpath_shapes.values() for p in pts]
-    if not all_x:
+    # Compute bounding box across all shapes from per-shape array reductions
+    boxes = [_bbox(pts) for pts in current_toolpath_shapes.values() if len(pts)]
+    if not boxes:
         ui.notify('No shape points found', type='warning')
         return
 
-    min_x, max_x = min(all_x), max(all_x)
-    min_y, max_y = min(all_y), max(all_y)
+    min_x = min(b[0] for b in boxes)
+    min_y = min(b[1] for b in boxes)
+    max_x = max(b[2] for b in boxes)
+    max_y = max(b[3] for b in boxes)
 
     trace_z = -15.0  # Fixed trace height for outline (never cuts material)
     safe_z = toolpath_generator.safe_height
@@ -1855,43 +1915,41 @@ async def start_job():
     if not await safety_confirm():
         return
 
-    # Debug: Show gcode summary
-    print(f"\n--- Starting Job ---")
-    g0_count = sum(1 for line in current_gcode if line.startswith('G0'))
-    g1_count = sum(1 for line in current_gcode if line.startswith('G1'))
-    print(f"  Total lines: {len(current_gcode)}")
-    print(f"  Rapid moves (G0): {g0_count}")
-    print(f"  Cut moves (G1): {g1_count}")
-    print(f"{'='*60}\n")
+    # G-code summary for the job_start event: rapid (G0) / cut (G1) moves are
+    # counted with C-level substring scans rather than a Python loop per line
+    gcode_lines = current_gcode.splitlines()
+    g0_count = current_gcode.count('\nG0') + current_gcode.startswith('G0')
+    g1_count = current_gcode.count('\nG1') + current_gcode.startswith('G1')
+    logger.debug(f"Starting job: {len(gcode_lines)} lines, {g0_count} rapid (G0), {g1_count} cut (G1)")
     
     ui.notify('Starting job...', type='info')
-    log_event('job', 'job_start_clicked', gcode_lines=len(current_gcode),
+    log_event('job', 'job_start_clicked', gcode_lines=len(gcode_lines),
               g0_count=g0_count, g1_count=g1_count,
               filename=machine_state.loaded_filename)
     
     # Start job without callback - we'll monitor completion via state
-    cnc_controller.start_job(current_gcode)
+    cnc_controller.start_job(gcode_lines)
 
 
 def pause_job():
     """Handle pause job button click."""
     log_event('job', 'pause_clicked')
     cnc_controller.pause_job()
-    ui.notify('Job paused', type='warning')
+    _notify('Job paused', type='warning')
 
 
 def resume_job():
     """Handle resume job button click."""
     log_event('job', 'resume_clicked')
     cnc_controller.resume_job()
-    ui.notify('Job resumed', type='positive')
+    _notify('Job resumed', type='positive')
 
 
 def stop_job():
     """Handle stop job button click."""
     log_event('job', 'stop_clicked')
     cnc_controller.stop_job()
-    ui.notify('Job stopped', type='negative')
+    _notify('Job stopped', type='negative')
 
 
 async def resume_disconnect_job():
@@ -1912,48 +1970,55 @@ async def resume_disconnect_job():
 # Track previous status for change detection
 _previous_status = {'text': None}
 
+# Modifier classes for the header status pill (see .status-pill CSS)
+_STATUS_PILL_TONES = 'status-pill--idle status-pill--busy status-pill--error'
+
 async def update_ui(pos_labels, status_label, status_pill=None, status_icon=None):
     """Update UI with current machine state (called periodically)."""
-    # Update position display
     x, y, z, a = machine_state.get_position()
-    pos_labels['X'].set_text(f'{x:.2f} mm')
-    pos_labels['Y'].set_text(f'{y:.2f} mm')
-    pos_labels['Z'].set_text(f'{z:.2f} mm')
-    pos_labels['A'].set_text(f'{a:.2f} °')
-    
-    # Update toolhead position on canvas only while machine is running (avoid blocking JS thread when idle)
-    if machine_state.busy:
-        try:
-            await ui.run_javascript(f'if(window.toolpathCanvas) window.toolpathCanvas.updateToolhead({x}, {y})', timeout=0.5)
-        except Exception:
-            pass
-    
-    # Update status
     current_status = machine_state.status_text
-    status_label.set_text(current_status)
-
-    # Update status pill appearance
+    busy = machine_state.busy
+
+    # Snapshot at display precision (integer hundredths, so 12.3449 and
+    # 12.3451 compare equal without any float formatting); when nothing
+    # visible changed since this page's last tick there is nothing to push.
+    snapshot = (int(round(x * 100)), int(round(y * 100)), int(round(z * 100)), int(round(a * 100)),
+                current_status, busy)
+    last = getattr(status_label, '_last_ui_state', None)
+    if snapshot == last:
+        return
+    status_label._last_ui_state = snapshot
+
+    # Push only the fields that changed since this page's last push, in one
+    # run_javascript call; window.applyState merges them into its copy of the
+    # state and writes the labels in a single rAF pass.
+    values = (x, y, z, a, current_status, busy)
+    state = {key: values[i] for i, key in enumerate(('x', 'y', 'z', 'a', 'status', 'busy'))
+             if last is None or last[i] != snapshot[i]}
+    ui.run_javascript(f'if(window.applyState) window.applyState({json.dumps(state)})')
+
+    # Update status pill appearance — a single modifier class on the pill
+    # recolours the pill, icon and label together (one element update).
     if status_pill and status_icon:
         if current_status == 'Disconnected':
-            status_pill.style('background: #4a2d2d; border: 1px solid #7a3d3d;')
-            status_icon.classes(add='text-red-5', remove='text-green-4 text-yellow-4')
-            status_label.classes(add='text-red-5', remove='text-green-4 text-yellow-4')
-        elif machine_state.busy:
-            status_pill.style('background: #3d3a2d; border: 1px solid #6a5a3d;')
-            status_icon.classes(add='text-yellow-4', remove='text-green-4 text-red-5')
-            status_label.classes(add='text-yellow-4', remove='text-green-4 text-red-5')
+            tone = 'error'
+        elif busy:
+            tone = 'busy'
         else:
-            status_pill.style('background: #2d4a2d; border: 1px solid #3d5a3d;')
-            status_icon.classes(add='text-green-4', remove='text-red-5 text-yellow-4')
-            status_label.classes(add='text-green-4', remove='text-red-5 text-yellow-4')
+            tone = 'idle'
+        # classes() always pushes an update, so only touch the pill when the
+        # tone actually flips (the common idle tick sends nothing).
+        if getattr(status_pill, '_status_tone', None) != tone:
+            status_pill.classes(add=f'status-pill--{tone}', remove=_STATUS_PILL_TONES)
+            status_pill._status_tone = tone
 
     # Detect status changes and show notifications (Complete/Error only — 
     # disconnect/reconnect handled per-page in _update_ui_timer)
     if _previous_status['text'] != current_status:
         if current_status == 'Complete':
-            ui.notify('Job completed successfully!', type='positive')
+            _notify('Job completed successfully!', type='positive')
         elif current_status == 'Error':
-            ui.notify('Job error!', type='negative')
+            _notify('Job error!', type='negative')
         _previous_status['text'] = current_status
 
 
@@ -2000,293 +2065,43 @@ def login_page():
                 .props('color=primary').style('width: 100%;')
 
 
+# Fabric.js is served from /static when setup.sh has fetched it, so a kiosk
+# on a LAN without WAN access still gets a working canvas; CDN otherwise.
+_FABRIC_JS_SRC = ('/static/fabric.min.js'
+                  if (Path(__file__).parent / 'static' / 'fabric.min.js').exists()
+                  else 'https://cdnjs.cloudflare.com/ajax/libs/fabric.js/5.3.1/fabric.min.js')
+
+# Page head: the dark theme stylesheet, header/jog helpers, Fabric.js and the
+# canvas module. All static, so the browser caches them across page loads.
+# The two large scripts are preloaded so they download in parallel; head
+# scripts still execute in order, so the canvas module's onload also means
+# Fabric is ready.
+_HEAD_SCRIPTS = (
+    f'<link rel="preload" as="script" href="{_FABRIC_JS_SRC}">'
+    f'<link rel="preload" as="script" href="/static/toolpath_canvas.js?v={APP_VERSION}">'
+    f'<link rel="stylesheet" href="/static/theme.css?v={APP_VERSION}">'
+    f'<script src="/static/page.js?v={APP_VERSION}"></script>'
+    f'<script src="/static/jog_wheel.js?v={APP_VERSION}"></script>'
+    f'<script src="{_FABRIC_JS_SRC}"></script>'
+    f'<script src="/static/toolpath_canvas.js?v={APP_VERSION}" onload="window.__toolpathCanvasReady=true; window.dispatchEvent(new Event(\'toolpathCanvasReady\'))"></script>'
+)
+
+
 @ui.page('/')
 def main_page():
     """Main application page with responsive tabbed interface optimized for 1280x720 and larger."""
     
-    # Redirect to login if not authenticated for this boot session
+    # Redirect to login if not authenticated for this boot session. A plain
+    # HTTP redirect, so the browser goes straight to /login instead of first
+    # loading an empty page and opening its websocket just to navigate away
     if not app.storage.user.get('authenticated') or app.storage.user.get('boot_token') != _BOOT_TOKEN:
-        ui.navigate.to('/login')
-        return
+        return RedirectResponse('/login')
 
     # Enforce dark mode
     ui.dark_mode().enable()
     
-    # Disable scrolling on body and html + Material Design dark theme
-    ui.add_head_html('''
-        <style>
-            /* Base Layout - no scroll at normal sizes */
-            html, body {
-                overflow: hidden !important;
-                height: 100vh !important;
-                margin: 0 !important;
-                padding: 0 !important;
-                min-width: 1440px;
-            }
-            
-            /* Enable scrolling when window is too small */
-            @media (max-height: 600px) {
-                html, body {
-                    overflow: auto !important;
-                }
-            }
-            @media (max-width: 1440px) {
-                html, body {
-                    overflow-x: auto !important;
-                }
-            }
-            
-            /* Minimum app dimensions - enables scroll below this */
-            .q-page, .q-page-container, .q-layout {
-                min-width: 1440px;
-                overflow: hidden !important;
-            }
-            
-            /* Remove default Quasar tab panel padding to prevent overflow */
-            .q-tab-panels, .q-tab-panel {
-                padding: 0 !important;
-            }
-            
-            /* Single source of truth for tab content spacing */
-            .tab-content {
-                padding: 8px 8px 35px 8px !important;
-                height: 100% !important;
-                box-sizing: border-box !important;
-            }
-            
-            /* Material Design Dark Theme - Bambu Studio Inspired */
-            :root {
-                --md-bg-primary: #1e1e1e;
-                --md-bg-secondary: #252525;
-                --md-bg-elevated: #2d2d2d;
-                --md-bg-card: #333333;
-                --md-border: #404040;
-                --md-border-light: #4a4a4a;
-                --md-text-primary: #e0e0e0;
-                --md-text-secondary: #9e9e9e;
-                --md-accent-blue: #4a9eff;
-                --md-accent-green: #4caf50;
-                --md-accent-orange: #ff9800;
-                --md-accent-red: #f44336;
-            }
-            
-            /* Global Background */
-            body, .q-page, .q-page-container {
-                background-color: var(--md-bg-primary) !important;
-            }
-            
-            /* Compact Header */
-            header.q-header {
-                background: linear-gradient(180deg, #2a2a2a 0%, #252525 100%) !important;
-                border-bottom: 1px solid var(--md-border) !important;
-                min-height: 48px !important;
-                max-height: 48px !important;
-                height: 48px !important;
-                padding: 8px 16px !important;
-            }
-            
-            /* Cards - Subtle and tight */
-            .q-card {
-                background: var(--md-bg-card) !important;
-                border: 1px solid var(--md-border) !important;
-                border-radius: 8px !important;
-                box-shadow: none !important;
-            }
-            
-            /* Dense Buttons - Material Design 3 style */
-            .q-btn {
-                border-radius: 6px !important;
-                text-transform: none !important;
-                font-weight: 500 !important;
-                letter-spacing: 0.01em !important;
-                transition: all 0.15s ease !important;
-            }
-            
-            .q-btn:hover {
-                filter: brightness(1.1) !important;
-            }
-            
-            .q-btn--dense {
-                padding: 4px 12px !important;
-                min-height: 32px !important;
-            }
-            
-            /* Compact Tabs - Match sidebar style */
-            .q-tabs {
-                background: var(--md-bg-secondary) !important;
-                border-radius: 8px !important;
-                padding: 4px !important;
-            }
-            
-            .q-tab {
-                min-height: 40px !important;
-                padding: 0 16px !important;
-                border-radius: 6px !important;
-                margin: 2px !important;
-                text-transform: none !important;
-                font-weight: 500 !important;
-            }
-            
-            .q-tab--active {
-                background: var(--md-bg-elevated) !important;
-            }
-            
-            .q-tab-panels {
-                background: transparent !important;
-            }
-            
-            /* Hide number input spinners */
-            input[type=number]::-webkit-inner-spin-button,
-            input[type=number]::-webkit-outer-spin-button {
-                -webkit-appearance: none;
-                margin: 0;
-            }
-            input[type=number] {
-                -moz-appearance: textfield;
-            }
-
-            /* Toolbar input fields - fixed height to match buttons */
-            .toolbar-input .q-field__control {
-                height: 36px !important;
-                min-height: 36px !important;
-            }
-            .toolbar-input .q-field__native {
-                padding-top: 0 !important;
-                padding-bottom: 0 !important;
-            }
-            
-            /* Inputs - Clean and compact */
-            .q-field--outlined .q-field__control {
-                border-radius: 6px !important;
-                background: var(--md-bg-secondary) !important;
-            }
-            
-            .q-field--outlined .q-field__control:before {
-                border-color: var(--md-border) !important;
-            }
-            
-            .q-field--outlined.q-field--focused .q-field__control:after {
-                border-color: var(--md-accent-blue) !important;
-            }
-            
-            /* Upload Component */
-            .q-uploader {
-                background: var(--md-bg-secondary) !important;
-                border: 1px dashed var(--md-border) !important;
-                border-radius: 8px !important;
-            }
-            
-            .q-uploader__header {
-                background: var(--md-bg-elevated) !important;
-                border-bottom: 1px solid var(--md-border) !important;
-            }
-            
-            /* Separators */
-            .q-separator {
-                background: var(--md-border) !important;
-            }
-            
-            /* Header tabs styling */
-            .header-tabs {
-                background: transparent !important;
-                padding: 0 !important;
-                border-radius: 0 !important;
-            }
-            
-            .header-tabs .q-tab {
-                min-height: 36px !important;
-                padding: 0 10px !important;
-                border-radius: 4px !important;
-                margin: 0 2px !important;
-                opacity: 0.7;
-            }
-            
-            .header-tabs .q-tab--active {
-                background: rgba(255,255,255,0.1) !important;
-                opacity: 1;
-            }
-            
-            .header-tabs .q-tabs__content {
-                gap: 4px;
-            }
-            
-            /* Labels styling */
-            .text-h5, .text-h6 {
-                color: var(--md-text-primary) !important;
-            }
-            
-            .text-grey-7 {
-                color: var(--md-text-secondary) !important;
-            }
-            
-            /* Linear Progress */
-            .q-linear-progress {
-                border-radius: 4px !important;
-                background: var(--md-bg-secondary) !important;
-            }
-            
-            /* Dialog styling */
-            .q-dialog__inner > .q-card {
-                background: var(--md-bg-card) !important;
-                border: 1px solid var(--md-border-light) !important;
-            }
-            
-            /* Notification styling */
-            .q-notification {
-                border-radius: 8px !important;
-            }
-            
-            /* Log area */
-            .q-log {
-                background: var(--md-bg-secondary) !important;
-                border: 1px solid var(--md-border) !important;
-                border-radius: 6px !important;
-            }
-            
-            /* Checkbox styling */
-            .q-checkbox__inner {
-                color: var(--md-accent-blue) !important;
-            }
-            
-            /* Scrollbar styling */
-            ::-webkit-scrollbar {
-                width: 8px;
-                height: 8px;
-            }
-            
-            ::-webkit-scrollbar-track {
-                background: var(--md-bg-secondary);
-                border-radius: 4px;
-            }
-            
-            ::-webkit-scrollbar-thumb {
-                background: var(--md-border-light);
-                border-radius: 4px;
-            }
-            
-            ::-webkit-scrollbar-thumb:hover {
-                background: #5a5a5a;
-            }
-            
-            /* Tooltip styling */
-            .q-tooltip {
-                background: #484848 !important;
-                color: var(--md-text-primary) !important;
-                border-radius: 4px !important;
-                font-size: 12px !important;
-            }
-        </style>
-        <script>
-            // Reset scroll position when window is resized to normal size
-            window.addEventListener('resize', function() {
-                if (window.innerWidth >= 1440 && window.innerHeight >= 600) {
-                    window.scrollTo(0, 0);
-                    document.documentElement.scrollTop = 0;
-                    document.body.scrollTop = 0;
-                }
-            });
-        </script>
-    ''')
+    # Page-wide head content (dark theme CSS + page scripts), one injection
+    ui.add_head_html(_HEAD_SCRIPTS)
     
     pos_labels, status_label, tabs, job_tab, gcode_tab, wifi_tab, update_btn, status_pill, status_icon = create_header()
     
@@ -2341,16 +2156,9 @@ def main_page():
             update_btn.style('font-size: 11px; min-width: 140px; background: none; border: none;')
     ui.timer(300.0, _check_update_timer)  # Every 5 min — was 30 s; frequent git fetch stresses WiFi
     
-    # Register JavaScript functions for jog control
-    ui.run_javascript('''
-        window.jogAxis = async (axis, direction) => {
-            await fetch('/jog', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ axis: axis, direction: direction })
-            });
-        };
-    ''')
+    # Step jogs from window.jogAxis arrive over the page websocket
+    ui.on('jog_step', lambda e: _jog_step(e.args.get('axis'), e.args.get('direction'), 'js_event')
+          if isinstance(e.args, dict) else None)
     
     # Main content area - 48px header + 1px border = 49px, use 50px for safety
     with ui.column().classes('w-full mx-auto').style('height: calc(100vh - 50px); min-height: 600px; overflow: hidden;'):
@@ -2359,55 +2167,57 @@ def main_page():
             with ui.tab_panel(job_tab).classes('tab-content'):
                 # Card: full height
                 with ui.card().classes('w-full h-full').style('padding: 10px; box-sizing: border-box;'):
-                    with ui.row().classes('gap-2 w-full').style('height: 100%; flex-wrap: nowrap;'):
+                    with ui.element('div').classes('job-grid'):
                         # Left column: Job file and controls (fixed width, scrollable)
-                        with ui.column().classes('gap-2').style('flex: 0 0 200px; max-height: 100%; overflow-y: auto;'):
+                        with ui.column().classes('gap-2 job-column-left'):
                             create_file_controls()
                             ui.separator()
                             create_job_controls()
                         
                         # Center column: Toolbar + Interactive Toolpath Canvas (Fabric.js)
                         global toolpath_canvas
-                        with ui.column().style('flex: 1 1 0; min-width: 400px; gap: 10px; height: 100%; box-sizing: border-box;'):
+                        with ui.column().classes('job-column-center'):
                             # Toolbar row above canvas - no wrap
-                            with ui.row().classes('items-center gap-2').style('background: #2a2a2a; border-radius: 4px; padding: 6px 10px; width: 100%; flex-wrap: nowrap; flex-shrink: 0;'):
+                            with ui.row().classes('items-center gap-2 canvas-toolbar').style('background: #2a2a2a; border-radius: 4px; padding: 6px 10px; width: 100%; flex-wrap: nowrap; flex-shrink: 0;'):
                                 def _run_js_logged(action: str, js: str, **extras):
                                     log_event('transform', action, **extras)
                                     ui.run_javascript(js)
 
-                                # Transform tools
-                                ui.button('⬌', on_click=lambda: _run_js_logged('mirror_x', 'window.toolpathCanvas.mirrorX()')).props('dense flat').style('min-width: 36px; height: 36px; font-size: 22px; background-color: #2a2a2a; color: #4a9eff; display: flex; align-items: center; justify-content: center;').tooltip('Mirror X')
-                                ui.button('⬍', on_click=lambda: _run_js_logged('mirror_y', 'window.toolpathCanvas.mirrorY()')).props('dense flat').style('min-width: 36px; height: 36px; font-size: 22px; background-color: #2a2a2a; color: #4a9eff; display: flex; align-items: center; justify-content: center;').tooltip('Mirror Y')
+                                # Transform tools. Argument-free canvas actions run straight
+                                # from the browser (js_handler) with no server round trip;
+                                # the canvas logging shim still reports them as canvas_action.
+                                ui.button('⬌').on('click', js_handler='() => window.toolpathCanvas.mirrorX()').props('dense flat').classes('tb-btn').tooltip('Mirror X')
+                                ui.button('⬍').on('click', js_handler='() => window.toolpathCanvas.mirrorY()').props('dense flat').classes('tb-btn').tooltip('Mirror Y')
                                 
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')  # Separator
+                                ui.element('div').classes('tb-sep')  # Separator
                                 
                                 rotate_input = ui.number(value=90, format='%.0f').props('dense outlined').style('width: 60px; font-size: 13px;').classes('toolbar-input')
                                 ui.label('°').classes('text-body2').style('margin-right: 2px;')
-                                ui.button('↻', on_click=lambda: _run_js_logged('rotate', f'window.toolpathCanvas.rotateByDegrees({rotate_input.value})', degrees=rotate_input.value)).props('dense flat').style('min-width: 36px; height: 36px; font-size: 22px; background-color: #2a2a2a; color: #4a9eff; display: flex; align-items: center; justify-content: center;').tooltip('Rotate CW')
-                                ui.button('↺', on_click=lambda: _run_js_logged('rotate', f'window.toolpathCanvas.rotateByDegrees(-{rotate_input.value})', degrees=-rotate_input.value)).props('dense flat').style('min-width: 36px; height: 36px; font-size: 22px; background-color: #2a2a2a; color: #4a9eff; display: flex; align-items: center; justify-content: center;').tooltip('Rotate CCW')
+                                ui.button('↻', on_click=lambda: _run_js_logged('rotate', _canvas_js('rotateByDegrees', rotate_input.value), degrees=rotate_input.value)).props('dense flat').classes('tb-btn').tooltip('Rotate CW')
+                                ui.button('↺', on_click=lambda: _run_js_logged('rotate', _canvas_js('rotateByDegrees', -rotate_input.value), degrees=-rotate_input.value)).props('dense flat').classes('tb-btn').tooltip('Rotate CCW')
                                 
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')  # Separator
+                                ui.element('div').classes('tb-sep')  # Separator
                                 
                                 scale_input = ui.number(value=100, format='%.0f').props('dense outlined').style('width: 60px; font-size: 13px;').classes('toolbar-input')
                                 ui.label('%').classes('text-body2').style('margin-right: 2px;')
-                                ui.button('Scale', on_click=lambda: _run_js_logged('scale', f'window.toolpathCanvas.scaleShape({scale_input.value / 100})', factor=scale_input.value / 100)).props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #4a9eff;')
+                                ui.button('Scale', on_click=lambda: _run_js_logged('scale', _canvas_js('scaleShape', scale_input.value / 100), factor=scale_input.value / 100)).props('dense flat').classes('tb-btn-text')
                                 
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')  # Separator
+                                ui.element('div').classes('tb-sep')  # Separator
                                 
                                 # Pattern tools
                                 grid_x = ui.number(value=2, format='%.0f', min=1, max=10).props('dense outlined').style('width: 50px; font-size: 13px;').classes('toolbar-input')
                                 ui.label('×').classes('text-body2')
                                 grid_y = ui.number(value=2, format='%.0f', min=1, max=10).props('dense outlined').style('width: 50px; font-size: 13px;').classes('toolbar-input')
-                                ui.button('Grid', on_click=lambda: _run_js_logged('grid_array', f'window.toolpathCanvas.gridArray({int(grid_x.value)}, {int(grid_y.value)})', count_x=int(grid_x.value), count_y=int(grid_y.value))).props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #4a9eff;')
+                                ui.button('Grid', on_click=lambda: _run_js_logged('grid_array', _canvas_js('gridArray', int(grid_x.value), int(grid_y.value)), count_x=int(grid_x.value), count_y=int(grid_y.value))).props('dense flat').classes('tb-btn-text')
                                 
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')  # Separator
+                                ui.element('div').classes('tb-sep')  # Separator
                                 
                                 keep_orientation = ui.checkbox('Keep Orientation', value=True).props('dense').style('font-size: 12px;')
                                 nest_offset = ui.number(value=15, format='%.0f', min=1, max=20).props('dense outlined').style('width: 50px; font-size: 13px;').classes('toolbar-input').tooltip('Gap (mm)')
                                 
                                 async def do_nest():
                                     offset_val = int(nest_offset.value)
-                                    keep_orient = str(keep_orientation.value).lower()
+                                    keep_orient = bool(keep_orientation.value)
                                     logger.info(f"[NEST] do_nest start: offset={offset_val} keep={keep_orient} "
                                                 f"py_shape_count={len(current_toolpath_shapes)}")
                                     log_event('transform', 'nest_clicked', offset_mm=offset_val,
@@ -2417,7 +2227,7 @@ def main_page():
                                     _t_js = _time.monotonic()
                                     try:
                                         result = await ui.run_javascript(
-                                            f'window.toolpathCanvas.nestShapes({keep_orient}, {offset_val})',
+                                            _canvas_js('nestShapes', keep_orient, offset_val),
                                             timeout=30.0
                                         )
                                         logger.info(f"[NEST] do_nest JS sync-return after {_time.monotonic() - _t_js:.2f}s: {result!r}")
@@ -2442,7 +2252,7 @@ def main_page():
                                         elif 'width' in result and 'height' in result:
                                             ui.notify(f'Nested to {result["width"]:.0f}×{result["height"]:.0f}mm', type='positive')
                                 
-                                ui.button('Nest', on_click=do_nest).props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #4a9eff;')
+                                ui.button('Nest', on_click=do_nest).props('dense flat').classes('tb-btn-text')
                             
                             # Second toolbar row: Notch editing tool
                             notch_mode_state = {'active': False, 'btn': None}
@@ -2458,7 +2268,7 @@ def main_page():
                                     btn.props('dense flat')
                                     btn.style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #FF6B35;')
                                     btn.set_text('V Notch')
-                                ui.run_javascript(f"window.toolpathCanvas.setNotchMode({str(notch_mode_state['active']).lower()})")
+                                ui.run_javascript(_canvas_js('setNotchMode', notch_mode_state['active']))
 
                             def deactivate_notch_btn():
                                 """Reset the notch button to OFF state (called when JS auto-disables notch mode)."""
@@ -2472,18 +2282,18 @@ def main_page():
                             with ui.row().classes('items-center gap-2').style('background: #2a2a2a; border-radius: 4px; padding: 4px 10px; width: 100%; flex-shrink: 0;'):
                                 notch_btn = ui.button('V Notch', on_click=toggle_notch_mode).props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #FF6B35;').tooltip('Toggle notch tool — click nodes on shapes to add/remove V-notches')
                                 notch_mode_state['btn'] = notch_btn
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')
-                                ui.button(icon='align_horizontal_center', on_click=lambda: ui.run_javascript('window.toolpathCanvas.alignCentersVertical()')).props('dense flat').style('min-width: 36px; height: 36px; background-color: #2a2a2a; color: #4a9eff;').tooltip('Align Center — same X centerpoint')
-                                ui.button(icon='align_vertical_center', on_click=lambda: ui.run_javascript('window.toolpathCanvas.alignCentersHorizontal()')).props('dense flat').style('min-width: 36px; height: 36px; background-color: #2a2a2a; color: #4a9eff;').tooltip('Align Middle — same Y centerpoint')
-                                ui.button(icon='horizontal_distribute', on_click=lambda: ui.run_javascript('window.toolpathCanvas.distributeHorizontally()')).props('dense flat').style('min-width: 36px; height: 36px; background-color: #2a2a2a; color: #4a9eff;').tooltip('Distribute Horizontally — equal X spacing (need 3+ shapes)')
-                                ui.button(icon='vertical_distribute', on_click=lambda: ui.run_javascript('window.toolpathCanvas.distributeVertically()')).props('dense flat').style('min-width: 36px; height: 36px; background-color: #2a2a2a; color: #4a9eff;').tooltip('Distribute Vertically — equal Y spacing (need 3+ shapes)')
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')
+                                ui.element('div').classes('tb-sep')
+                                ui.button(icon='align_horizontal_center').on('click', js_handler='() => window.toolpathCanvas.alignCentersVertical()').props('dense flat').classes('tb-btn-icon').tooltip('Align Center — same X centerpoint')
+                                ui.button(icon='align_vertical_center').on('click', js_handler='() => window.toolpathCanvas.alignCentersHorizontal()').props('dense flat').classes('tb-btn-icon').tooltip('Align Middle — same Y centerpoint')
+                                ui.button(icon='horizontal_distribute').on('click', js_handler='() => window.toolpathCanvas.distributeHorizontally()').props('dense flat').classes('tb-btn-icon').tooltip('Distribute Horizontally — equal X spacing (need 3+ shapes)')
+                                ui.button(icon='vertical_distribute').on('click', js_handler='() => window.toolpathCanvas.distributeVertically()').props('dense flat').classes('tb-btn-icon').tooltip('Distribute Vertically — equal Y spacing (need 3+ shapes)')
+                                ui.element('div').classes('tb-sep')
                                 spread_spacing = ui.number(value=15, format='%.0f', min=1, max=200).props('dense outlined').style('width: 50px; font-size: 13px;').classes('toolbar-input').tooltip('Min gap between shape outlines (mm)')
-                                ui.button('Spread', on_click=lambda: ui.run_javascript(f'window.toolpathCanvas.ensureSpacing({int(spread_spacing.value)})')).props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #4a9eff;').tooltip('Push shapes apart so every outline gap ≥ spacing value')
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')
+                                ui.button('Spread', on_click=lambda: ui.run_javascript(_canvas_js('ensureSpacing', int(spread_spacing.value)))).props('dense flat').classes('tb-btn-text').tooltip('Push shapes apart so every outline gap ≥ spacing value')
+                                ui.element('div').classes('tb-sep')
                                 ui.element('div').style('flex: 1;')
-                                ui.button('⌖ Reset Zoom', on_click=lambda: ui.run_javascript('window.toolpathCanvas.resetZoom()')).props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #aaaaaa;').tooltip('Reset zoom & pan to fit the full work area (or scroll to zoom, Alt+drag to pan)')
-                                ui.element('div').style('width: 1px; height: 24px; background: #4a4a4a; margin: 0 4px;')
+                                ui.button('⌖ Reset Zoom').on('click', js_handler='() => window.toolpathCanvas.resetZoom()').props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #aaaaaa;').tooltip('Reset zoom & pan to fit the full work area (or scroll to zoom, Alt+drag to pan)')
+                                ui.element('div').classes('tb-sep')
 
                                 # Units toggle: mm ↔ in
                                 units_state = {'unit': 'mm'}
@@ -2496,14 +2306,10 @@ def main_page():
                                         units_state['unit'] = 'mm'
                                         units_btn.set_text('mm')
                                     unit = units_state['unit']
-                                    await ui.run_javascript(f"window.toolpathCanvas.setUnits('{unit}')")
+                                    await ui.run_javascript(_canvas_js('setUnits', unit))
 
                                 units_btn = ui.button('mm', on_click=toggle_units).props('dense flat').style('height: 36px; font-size: 13px; background-color: #2a2a2a; color: #aaaaaa; min-width: 52px;').tooltip('Toggle axis units between mm and inches')
                             
-                            # Load Fabric.js library
-                            ui.add_head_html('<script src="https://cdnjs.cloudflare.com/ajax/libs/fabric.js/5.3.1/fabric.min.js"></script>')
-                            ui.add_head_html(f'<script src="/static/toolpath_canvas.js?v={APP_VERSION}"></script>')
-                            
                             # Create canvas container - flex fills space
                             toolpath_canvas = ui.html('''
                                 <div id="canvas-container" style="width: 100%; height: 100%; min-width: 400px; background-color: #1e1e1e; border-radius: 4px; overflow: hidden;">
@@ -2516,31 +2322,16 @@ def main_page():
                                 await ui.context.client.connected()
                                 for _ in range(10):  # retry up to 10x if JS not ready
                                     try:
-                                        await ui.run_javascript('''
-                                            // Wait for Fabric.js and our canvas module to be ready
-                                            function initWhenReady() {
-                                                const container = document.getElementById('canvas-container');
-                                                const canvasEl = document.getElementById('toolpath-canvas');
-                                                if (typeof fabric !== 'undefined' && window.toolpathCanvas && container && canvasEl) {
-                                                    console.log('Initializing toolpath canvas...');
-                                                    window.toolpathCanvas.init("toolpath-canvas");
-                                                    return true;
-                                                } else {
-                                                    console.log('Waiting for dependencies... fabric:', typeof fabric, 'toolpathCanvas:', !!window.toolpathCanvas, 'container:', !!container);
-                                                    setTimeout(initWhenReady, 100);
-                                                    return false;
-                                                }
-                                            }
-                                            initWhenReady();
-                                        ''', timeout=3.0)
+                                        await ui.run_javascript('window.initToolpathCanvas()', timeout=3.0)
                                         break  # success
                                     except Exception:
                                         await asyncio.sleep(0.5)
 
                                 # Restore shapes and toolpath if they already exist server-side
                                 # (handles page reload mid-session due to WebSocket reconnect)
+                                # (initToolpathCanvas only resolves once init has run, so
+                                # there is nothing left to wait for here)
                                 if current_toolpath_shapes:
-                                    await asyncio.sleep(0.4)  # let canvas finish initialising
                                     add_shapes_to_canvas(
                                         current_toolpath_shapes,
                                         breaks=current_toolpath_breaks,
@@ -2551,7 +2342,7 @@ def main_page():
                                         await asyncio.sleep(0.1)
                                         try:
                                             await ui.run_javascript(
-                                                f'window.toolpathCanvas.restoreNotches({json.dumps(current_toolpath_notches)})',
+                                                _canvas_js('restoreNotches', current_toolpath_notches),
                                                 timeout=5.0,
                                             )
                                         except Exception as exc:
@@ -2577,39 +2368,51 @@ def main_page():
                                         except Exception:
                                             pass
                             
-                            # Schedule initialization
-                            ui.timer(0.5, init_canvas_after_load, once=True)
+                            # Schedule initialization (waits for the client connection itself)
+                            ui.timer(0, init_canvas_after_load, once=True)
                             
-                            # Handle shape moved events from JavaScript
-                            def on_shape_moved(e):
-                                global current_toolpath_shapes
-                                # e.args contains the data passed from emitEvent
-                                data = e.args if isinstance(e.args, dict) else (e.args[0] if e.args else {})
-                                shape_name = data.get('shapeName') if isinstance(data, dict) else None
-                                new_points = data.get('newPoints') if isinstance(data, dict) else None
-                                
-                                # Debug logging
-                                if new_points:
-                                    x_vals = [p[0] for p in new_points]
-                                    y_vals = [p[1] for p in new_points]
-                                    logger.info(f"SHAPE MOVE DEBUG: Received {len(new_points)} points")
-                                    logger.info(f"SHAPE MOVE DEBUG: X range: {min(x_vals):.1f} to {max(x_vals):.1f}")
-                                    logger.info(f"SHAPE MOVE DEBUG: Y range: {min(y_vals):.1f} to {max(y_vals):.1f}")
-                                
+                            # Handle shape moved events from JavaScript.
+                            # A single drop can arrive several times (object:moved
+                            # plus object:modified, or one event per shape when a
+                            # selection is aligned/distributed), so the stored
+                            # points update immediately but the debug/event-log
+                            # write is debounced per shape to the last event.
+                            _move_log_handles = {}  # shape_name -> call_later handle
+
+                            def _log_shape_moved(shape_name):
+                                _move_log_handles.pop(shape_name, None)
+                                new_points = current_toolpath_shapes.get(shape_name)
+                                if not new_points:
+                                    return
+                                min_x, min_y, max_x, max_y = _bbox(new_points)
+                                logger.debug(f"Shape '{shape_name}' moved: {len(new_points)} pts, "
+                                             f"X({min_x:.1f} to {max_x:.1f}), Y({min_y:.1f} to {max_y:.1f})")
+                                try:
+                                    log_event('canvas', 'shape_moved', shape=shape_name,
+                                              bbox=[min_x, min_y, max_x, max_y],
+                                              point_count=len(new_points))
+                                except Exception:
+                                    log_event('canvas', 'shape_moved', shape=shape_name)
+
+                            def _apply_shape_move(shape_name, new_points):
                                 if shape_name and new_points:
                                     # Update the stored shapes with new positions
-                                    current_toolpath_shapes[shape_name] = [tuple(p) for p in new_points]
-                                    logger.info(f"Shape '{shape_name}' moved to new position")
-                                    try:
-                                        xs = [p[0] for p in new_points]
-                                        ys = [p[1] for p in new_points]
-                                        log_event('canvas', 'shape_moved', shape=shape_name,
-                                                  bbox=[min(xs), min(ys), max(xs), max(ys)],
-                                                  point_count=len(new_points))
-                                    except Exception:
-                                        log_event('canvas', 'shape_moved', shape=shape_name)
+                                    current_toolpath_shapes[shape_name] = list(map(tuple, new_points))
+                                    h = _move_log_handles.get(shape_name)
+                                    if h is not None:
+                                        h.cancel()
+                                    _move_log_handles[shape_name] = asyncio.get_event_loop().call_later(
+                                        0.25, _log_shape_moved, shape_name)
+
+                            # The canvas coalesces moves per animation frame into one
+                            # event: {moves: [{shapeName, newPoints}, ...]}
+                            def on_shapes_moved(e):
+                                data = e.args if isinstance(e.args, dict) else {}
+                                for move in data.get('moves') or []:
+                                    if isinstance(move, dict):
+                                        _apply_shape_move(move.get('shapeName'), move.get('newPoints'))
                             
-                            ui.on('shape_moved', on_shape_moved)
+                            ui.on('shapes_moved', on_shapes_moved)
                             
                             # Handle nest diagnostic events from JavaScript (timing checkpoints,
                             # uncaught errors, etc.). All logged to app.log for post-mortem.
@@ -2638,6 +2441,7 @@ def main_page():
                                     current_toolpath_breaks.pop(shape_name, None)
                                     current_toolpath_types.pop(shape_name, None)
                                     current_toolpath_notches.pop(shape_name, None)
+                                    _shape_json_cache.pop(shape_name, None)
                                     logger.info(f"Shape '{shape_name}' deleted from toolpath shapes")
                                     log_event('canvas', 'shape_deleted', shape=shape_name)
                                     # Clear toolpath if it was generated since shapes changed
@@ -2689,466 +2493,520 @@ def main_page():
                             ui.on('notches_changed', on_notches_changed)
                         
                         # Right column: Jog Controls only (fixed width)
-                        with ui.column().classes('gap-2 items-center').style('flex: 0 0 320px; padding: 0 0 10px 0; box-sizing: border-box;'):
+                        with ui.column().classes('gap-2 items-center job-column-right'):
                             # Control section - Jog wheel and controls
-                            ui.label('Control').classes('text-body1 font-bold w-full text-center').style('color: #aaa; background-color: #2a2a2a; padding: 6px 10px; border-radius: 4px; height: 48px; display: flex; align-items: center; justify-content: center; box-sizing: border-box;')
+                            ui.label('Control').classes('text-body1 font-bold w-full text-center').style(_PANEL_HEADER_STYLE)
                             create_jog_controls()
             
             # GCODE tab - Manual G-code command interface
-            with ui.tab_panel(gcode_tab).classes('tab-content'):
-                with ui.card().classes('w-full h-full').style('padding: 12px; box-sizing: border-box;'):
-                    ui.label('Manual G-code Commands').classes('text-body1 font-bold mb-2').style('color: #aaa;')
+            gcode_panel = ui.tab_panel(gcode_tab).classes('tab-content')
+
+            def build_gcode_tab():
+                with gcode_panel:
+                    with ui.card().classes('w-full h-full').style('padding: 12px; box-sizing: border-box;'):
+                        ui.label('Manual G-code Commands').classes('text-body1 font-bold mb-2').style('color: #aaa;')
                     
-                    # Command input
-                    with ui.row().classes('w-full gap-2 items-center mb-3'):
-                        gcode_input = ui.input('Enter G-code command').classes('flex-1').props('outlined dense')
+                        # Command input
+                        with ui.row().classes('w-full gap-2 items-center mb-3'):
+                            gcode_input = ui.input('Enter G-code command').classes('flex-1').props('outlined dense')
                         
-                        async def send_gcode():
-                            cmd = gcode_input.value.strip()
-                            if cmd:
-                                response_log.push(f'>>> {cmd}')
-                                log_event('manual_gcode', 'send', command=cmd)
-                                response = cnc_controller.send_command_with_response(cmd, timeout=10.0)
-                                for line in response.split('\n'):
-                                    response_log.push(f'<<< {line}')
-                                log_event('manual_gcode', 'response', command=cmd,
-                                          response=response[:500])
-                                gcode_input.value = ''
+                            async def send_gcode():
+                                cmd = gcode_input.value.strip()
+                                if cmd:
+                                    response_log.push(f'>>> {cmd}')
+                                    log_event('manual_gcode', 'send', command=cmd)
+                                    # Serial round-trip can take up to the 10 s timeout — run it off the event loop
+                                    loop = asyncio.get_running_loop()
+                                    response = await loop.run_in_executor(
+                                        None, functools.partial(cnc_controller.send_command_with_response, cmd, timeout=10.0))
+                                    # One push for the whole reply (ui.log splits on newlines),
+                                    # not one log update per line of e.g. an M503 dump
+                                    response_log.push('\n'.join([f'<<< {line}' for line in response.split('\n')]))
+                                    log_event('manual_gcode', 'response', command=cmd,
+                                              response=response[:500])
+                                    gcode_input.value = ''
                         
-                        ui.button('Send', on_click=send_gcode, icon='send').props('color=primary dense')
+                            ui.button('Send', on_click=send_gcode, icon='send').props('color=primary dense')
                     
-                    # Common commands
-                    ui.label('Quick Commands:').classes('text-body2 mb-1').style('color: #888;')
-                    with ui.row().classes('gap-1 mb-3'):
-                        ui.button('M115', on_click=lambda: [gcode_input.set_value('M115'), send_gcode()]).props('dense outline').style('font-size: 11px;').tooltip('Firmware')
-                        ui.button('M114', on_click=lambda: [gcode_input.set_value('M114'), send_gcode()]).props('dense outline').style('font-size: 11px;').tooltip('Position')
-                        ui.button('M503', on_click=lambda: [gcode_input.set_value('M503'), send_gcode()]).props('dense outline').style('font-size: 11px;').tooltip('Settings')
-                        ui.button('M999', on_click=lambda: [gcode_input.set_value('M999'), send_gcode()]).props('dense outline color=orange').style('font-size: 11px;').tooltip('Reset')
+                        # Common commands — fill the input and send; awaited so the
+                        # coroutine actually runs (a lambda would drop it)
+                        async def _quick_gcode(cmd):
+                            gcode_input.set_value(cmd)
+                            await send_gcode()
                     
-                    # Response log
-                    ui.label('Response Log:').classes('text-body2 mb-1').style('color: #888;')
-                    response_log = ui.log().classes('w-full').style('height: 280px; font-family: monospace; font-size: 14px;')
+                        ui.label('Quick Commands:').classes('text-body2 mb-1').style('color: #888;')
+                        with ui.row().classes('gap-1 mb-3'):
+                            ui.button('M115', on_click=functools.partial(_quick_gcode, 'M115')).props('dense outline').style('font-size: 11px;').tooltip('Firmware')
+                            ui.button('M114', on_click=functools.partial(_quick_gcode, 'M114')).props('dense outline').style('font-size: 11px;').tooltip('Position')
+                            ui.button('M503', on_click=functools.partial(_quick_gcode, 'M503')).props('dense outline').style('font-size: 11px;').tooltip('Settings')
+                            ui.button('M999', on_click=functools.partial(_quick_gcode, 'M999')).props('dense outline color=orange').style('font-size: 11px;').tooltip('Reset')
                     
-                    # Allow enter key to send command
-                    gcode_input.on('keydown.enter', send_gcode)
-            
+                        # Response log
+                        ui.label('Response Log:').classes('text-body2 mb-1').style('color: #888;')
+                        response_log = ui.log(max_lines=500).classes('w-full').style('height: 280px; font-family: monospace; font-size: 14px;')
+                    
+                        # Allow enter key to send command
+                        gcode_input.on('keydown.enter', send_gcode)
+
             # System tab - WiFi, connection info, and system controls
-            with ui.tab_panel(wifi_tab).classes('tab-content'):
-                with ui.card().classes('w-full h-full').style('padding: 12px; box-sizing: border-box;'):
-                    with ui.row().classes('w-full gap-6'):
-                        # Left column: Connection info
-                        with ui.column().classes('gap-3').style('flex: 1;'):
-                            ui.label('Connection Info').classes('text-body1 font-bold mb-1').style('color: #aaa;')
+            sys_panel = ui.tab_panel(wifi_tab).classes('tab-content')
+
+            def build_system_tab():
+                with sys_panel:
+                    with ui.card().classes('w-full h-full').style('padding: 12px; box-sizing: border-box;'):
+                        with ui.row().classes('w-full gap-6'):
+                            # Left column: Connection info
+                            with ui.column().classes('gap-3').style('flex: 1;'):
+                                ui.label('Connection Info').classes('text-body1 font-bold mb-1').style('color: #aaa;')
                             
-                            # Connection status
-                            with ui.row().classes('items-center gap-2'):
-                                ui.label('CNC Status:').classes('text-body2').style('color: #888;')
-                                sys_connection_icon = ui.icon('check_circle', color='green', size='20px')
-                                sys_connection_label = ui.label('Connected').classes('text-body1 font-bold')
+                                # Connection status
+                                with ui.row().classes('items-center gap-2'):
+                                    ui.label('CNC Status:').classes('text-body2').style('color: #888;')
+                                    sys_connection_icon = ui.icon('check_circle', color='green', size='20px')
+                                    sys_connection_label = ui.label('Connected').classes('text-body1 font-bold')
                                 
-                                def update_sys_connection():
-                                    if cnc_controller.connected:
-                                        sys_connection_icon.props('name=check_circle color=green')
-                                        sys_connection_label.set_text('Connected')
-                                    else:
-                                        sys_connection_icon.props('name=cancel color=red')
-                                        sys_connection_label.set_text('Disconnected')
+                                    def update_sys_connection():
+                                        if cnc_controller.connected:
+                                            sys_connection_icon.props('name=check_circle color=green')
+                                            sys_connection_label.set_text('Connected')
+                                        else:
+                                            sys_connection_icon.props('name=cancel color=red')
+                                            sys_connection_label.set_text('Disconnected')
                                 
-                                ui.timer(1.0, update_sys_connection)
+                                    # Only poll while the System tab is showing; refresh once
+                                    # on entry so the label is current when it appears. This
+                                    # runs on the first switch to the tab, so it starts active.
+                                    sys_timer = ui.timer(1.0, update_sys_connection)
+                                    update_sys_connection()
+
+                                    def _on_system_tab(e):
+                                        if e.value is wifi_tab or e.value == 'System':
+                                            update_sys_connection()
+                                            sys_timer.activate()
+                                        else:
+                                            sys_timer.deactivate()
+
+                                    tabs.on_value_change(_on_system_tab)
                             
-                            # IP Address
-                            local_ip = get_local_ip()
-                            with ui.row().classes('items-center gap-2'):
-                                ui.label('IP Address:').classes('text-body2').style('color: #888;')
-                                ui.label(f'http://{local_ip}:8080').classes('text-body1 font-bold px-2 py-1 rounded').style('background: #2a2a2a;')
+                                # IP Address
+                                local_ip = get_local_ip()
+                                with ui.row().classes('items-center gap-2'):
+                                    ui.label('IP Address:').classes('text-body2').style('color: #888;')
+                                    ui.label(f'http://{local_ip}:8080').classes('text-body1 font-bold px-2 py-1 rounded').style('background: #2a2a2a;')
                             
-                            ui.separator().classes('my-3')
+                                ui.separator().classes('my-3')
                             
-                            ui.label('System Controls').classes('text-body1 font-bold mb-1').style('color: #aaa;')
+                                ui.label('System Controls').classes('text-body1 font-bold mb-1').style('color: #aaa;')
                             
-                            with ui.row().classes('gap-2'):
-                                async def restart_service():
-                                    ui.notify('Restarting service...', type='warning')
-                                    await ui.run_javascript('setTimeout(() => window.location.reload(), 5000)')
-                                    import sys
-                                    sys.exit(0)
+                                with ui.row().classes('gap-2'):
+                                    async def restart_service():
+                                        ui.notify('Restarting service...', type='warning')
+                                        await ui.run_javascript('setTimeout(() => window.location.reload(), 5000)')
+                                        import sys
+                                        sys.exit(0)
                                 
-                                ui.button('Restart Service', icon='refresh', on_click=restart_service) \
-                                    .props('color=warning dense').style('font-size: 13px;')
+                                    ui.button('Restart Service', icon='refresh', on_click=restart_service) \
+                                        .props('color=warning dense').style('font-size: 13px;')
                                 
-                                def reboot_system():
-                                    ui.notify('Rebooting system...', type='warning')
-                                    subprocess.Popen(['sudo', 'reboot'], 
-                                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                                    def reboot_system():
+                                        ui.notify('Rebooting system...', type='warning')
+                                        subprocess.Popen(['sudo', 'reboot'], 
+                                                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                                 
-                                ui.button('Reboot System', icon='restart_alt', on_click=reboot_system) \
-                                    .props('color=negative dense').style('font-size: 13px;')
+                                    ui.button('Reboot System', icon='restart_alt', on_click=reboot_system) \
+                                        .props('color=negative dense').style('font-size: 13px;')
 
-                            ui.separator().classes('my-3')
-                            ui.label('WiFi').classes('text-body1 font-bold mb-1').style('color: #aaa;')
+                                ui.separator().classes('my-3')
+                                ui.label('WiFi').classes('text-body1 font-bold mb-1').style('color: #aaa;')
 
-                            wifi_status_label = ui.label('Press Scan to find networks.').classes('text-caption').style('color: #888;')
-                            wifi_select = ui.select(options={}, label='Available networks').style('min-width: 260px;')
+                                wifi_status_label = ui.label('Press Scan to find networks.').classes('text-caption').style('color: #888;')
+                                wifi_select = ui.select(options={}, label='Available networks').style('min-width: 260px;')
 
-                            def _parse_wifi_networks():
-                                """Return (networks_list, raw_output) using multiline nmcli mode."""
-                                import collections, time
-                                # Force a fresh scan; goodpigeon has NOPASSWD sudo
-                                try:
-                                    subprocess.run(
-                                        ['sudo', 'nmcli', 'device', 'wifi', 'rescan'],
-                                        capture_output=True, text=True, timeout=10
+                                def _parse_wifi_networks():
+                                    """Return (networks_list, raw_output) using multiline nmcli mode."""
+                                    import collections, time
+                                    # Force a fresh scan; goodpigeon has NOPASSWD sudo
+                                    try:
+                                        subprocess.run(
+                                            ['sudo', 'nmcli', 'device', 'wifi', 'rescan'],
+                                            capture_output=True, text=True, timeout=10
+                                        )
+                                        time.sleep(4)
+                                    except Exception:
+                                        pass
+                                    result = subprocess.run(
+                                        ['nmcli', '--mode', 'multiline', '-f',
+                                         'IN-USE,SSID,SIGNAL,SECURITY', 'device', 'wifi', 'list'],
+                                        capture_output=True, text=True, timeout=15
                                     )
-                                    time.sleep(4)
-                                except Exception:
-                                    pass
-                                result = subprocess.run(
-                                    ['nmcli', '--mode', 'multiline', '-f',
-                                     'IN-USE,SSID,SIGNAL,SECURITY', 'device', 'wifi', 'list'],
-                                    capture_output=True, text=True, timeout=15
-                                )
-                                raw = result.stdout
-                                # multiline format: indexed "FIELD[N]: value" or non-indexed "FIELD: value"
-                                # Non-indexed: nmcli omits [N] on all records on some versions/configs;
-                                # detect record boundaries by watching for IN-USE repeating.
-                                entries = collections.defaultdict(dict)
-                                current_idx = 0
-                                for line in raw.splitlines():
-                                    # indexed form: FIELD[N]: value
-                                    m = re.match(r'^([A-Z_-]+)\[(\d+)\]:\s*(.*)', line)
-                                    if m:
-                                        field, idx, val = m.group(1), m.group(2), m.group(3).strip()
-                                        entries[idx][field.lower().replace('-', '_')] = val
-                                        continue
-                                    # non-indexed form: FIELD: value
-                                    m2 = re.match(r'^([A-Z_-]+):\s*(.*)', line)
-                                    if m2:
-                                        field, val = m2.group(1), m2.group(2).strip()
-                                        field_key = field.lower().replace('-', '_')
-                                        # IN-USE marks the start of each record
-                                        if field_key == 'in_use' and 'in_use' in entries[str(current_idx)]:
-                                            current_idx += 1
-                                        entries[str(current_idx)][field_key] = val
-                                networks = []
-                                seen = set()
-                                for idx in sorted(entries, key=lambda x: int(x)):
-                                    e = entries[idx]
-                                    ssid = e.get('ssid', '').strip()
-                                    if not ssid or ssid in seen:
-                                        continue
-                                    seen.add(ssid)
-                                    networks.append({
-                                        'ssid': ssid,
-                                        'signal': e.get('signal', '?'),
-                                        'security': e.get('security', ''),
-                                        'in_use': e.get('in_use', '') == '*',
-                                    })
-                                networks.sort(
-                                    key=lambda x: int(x['signal']) if x['signal'].isdigit() else 0,
-                                    reverse=True
-                                )
-                                return networks, raw
-
-                            async def scan_wifi():
-                                wifi_status_label.set_text('Scanning…')
-                                wifi_select.set_options({})
-                                loop = asyncio.get_event_loop()
-                                try:
-                                    networks, raw = await loop.run_in_executor(None, _parse_wifi_networks)
-                                except Exception as exc:
-                                    wifi_status_label.set_text(f'Scan failed: {exc}')
-                                    return
-                                if not networks:
-                                    # show raw output to help diagnose
-                                    wifi_status_label.set_text(f'No networks parsed. Raw: {raw[:200]!r}')
-                                    return
-                                options = {}
-                                for n in networks:
-                                    label = f"{'★ ' if n['in_use'] else ''}{n['ssid']}  ({n['signal']}%{', ' + n['security'] if n['security'] else ''})"
-                                    options[n['ssid']] = label
-                                wifi_select.set_options(options)
-                                wifi_status_label.set_text(f"Found {len(networks)} network(s).")
-
-                            def open_connect_dialog():
-                                ssid = wifi_select.value
-                                if not ssid:
-                                    ui.notify('Select a network first.', type='warning')
-                                    return
-                                with ui.dialog() as conn_dlg, ui.card().style('min-width: 320px;'):
-                                    ui.label(f'Connect to "{ssid}"').classes('text-h6')
-                                    pwd_input = ui.input('Password', password=True, password_toggle_button=True).classes('w-full')
-                                    conn_status = ui.label('').classes('text-caption').style('color: #f88;')
-                                    with ui.row().classes('gap-2 justify-end w-full mt-2'):
-                                        ui.button('Cancel', on_click=conn_dlg.close).props('flat dense')
-                                        async def do_connect():
-                                            conn_status.set_text('Connecting…')
-                                            pwd = pwd_input.value
-                                            loop = asyncio.get_event_loop()
-                                            def run_connect():
-                                                # Delete any stale/incomplete profile for this SSID
-                                                # (avoids "key-mgmt: property is missing" from old profiles)
-                                                subprocess.run(
-                                                    ['sudo', 'nmcli', 'connection', 'delete', ssid],
-                                                    capture_output=True, text=True, timeout=10
-                                                )
-                                                cmd = ['sudo', 'nmcli', 'device', 'wifi', 'connect', ssid]
-                                                if pwd:
-                                                    cmd += ['password', pwd]
-                                                return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                                            result = await loop.run_in_executor(None, run_connect)
-                                            if result.returncode == 0:
-                                                conn_dlg.close()
-                                                ui.notify(f'Connected to {ssid}', type='positive')
-                                                wifi_status_label.set_text(f'Connected to {ssid}')
-                                            else:
-                                                err = result.stderr.strip() or result.stdout.strip()
-                                                conn_status.set_text(err or 'Connection failed.')
-                                        ui.button('Connect', on_click=do_connect).props('color=primary dense')
-                                conn_dlg.open()
-
-                            def confirm_forget_wifi():
-                                with ui.dialog() as dlg, ui.card():
-                                    ui.label('Forget all WiFi networks?').classes('text-h6')
-                                    ui.label(
-                                        'This will delete all saved WiFi connections and reboot the Pi. '
-                                        'On next boot it will create a "fabCNC Setup" hotspot.'
-                                    ).classes('text-body2').style('color: #aaa; max-width: 340px;')
-                                    with ui.row().classes('gap-2 justify-end w-full mt-4'):
-                                        ui.button('Cancel', on_click=dlg.close).props('flat dense')
-                                        def do_forget():
-                                            dlg.close()
-                                            ui.notify('Removing WiFi connections and rebooting…', type='warning')
-                                            subprocess.Popen(
-                                                'bash -c \''
-                                                'nmcli -t -f NAME,TYPE connection show'
-                                                ' | grep ":802-11-wireless$"'
-                                                ' | cut -d: -f1'
-                                                ' | while IFS= read -r n; do nmcli connection delete "$n"; done'
-                                                '; sudo reboot\'',
-                                                shell=True,
-                                                stdout=subprocess.DEVNULL,
-                                                stderr=subprocess.DEVNULL,
-                                            )
-                                        ui.button('Forget & Reboot', on_click=do_forget).props('color=negative dense')
-                                dlg.open()
-
-                            with ui.row().classes('gap-2 items-center'):
-                                ui.button('Scan', icon='wifi_find', on_click=scan_wifi).props('dense outline').style('font-size: 13px;')
-                                ui.button('Connect', icon='wifi', on_click=open_connect_dialog).props('color=primary dense').style('font-size: 13px;')
-                                ui.button('Forget All & Reboot', icon='wifi_off', on_click=confirm_forget_wifi).props('color=negative dense').style('font-size: 13px;')
-
-                            ui.separator().classes('my-3')
-
-                            ui.label('Debug').classes('text-body1 font-bold mb-1').style('color: #aaa;')
-
-                            async def send_logs_to_dev():
-                                ui.notify('Sending logs…', type='info')
-                                loop = asyncio.get_event_loop()
-                                result = await loop.run_in_executor(None, log_uploader.upload_now, False, "manual")
-                                if result.get('ok'):
-                                    ui.notify(
-                                        f"Logs sent — {result.get('bytes', 0)//1024} KB",
-                                        type='positive',
+                                    raw = result.stdout
+                                    # multiline format: indexed "FIELD[N]: value" or non-indexed "FIELD: value"
+                                    # Non-indexed: nmcli omits [N] on all records on some versions/configs;
+                                    # detect record boundaries by watching for IN-USE repeating.
+                                    entries = collections.defaultdict(dict)
+                                    current_idx = 0
+                                    for line in raw.splitlines():
+                                        # indexed form: FIELD[N]: value
+                                        m = re.match(r'^([A-Z_-]+)\[(\d+)\]:\s*(.*)', line)
+                                        if m:
+                                            field, idx, val = m.group(1), m.group(2), m.group(3).strip()
+                                            entries[idx][field.lower().replace('-', '_')] = val
+                                            continue
+                                        # non-indexed form: FIELD: value
+                                        m2 = re.match(r'^([A-Z_-]+):\s*(.*)', line)
+                                        if m2:
+                                            field, val = m2.group(1), m2.group(2).strip()
+                                            field_key = field.lower().replace('-', '_')
+                                            # IN-USE marks the start of each record
+                                            if field_key == 'in_use' and 'in_use' in entries[str(current_idx)]:
+                                                current_idx += 1
+                                            entries[str(current_idx)][field_key] = val
+                                    networks = []
+                                    seen = set()
+                                    for idx in sorted(entries, key=lambda x: int(x)):
+                                        e = entries[idx]
+                                        ssid = e.get('ssid', '').strip()
+                                        if not ssid or ssid in seen:
+                                            continue
+                                        seen.add(ssid)
+                                        networks.append({
+                                            'ssid': ssid,
+                                            'signal': e.get('signal', '?'),
+                                            'security': e.get('security', ''),
+                                            'in_use': e.get('in_use', '') == '*',
+                                        })
+                                    networks.sort(
+                                        key=lambda x: int(x['signal']) if x['signal'].isdigit() else 0,
+                                        reverse=True
                                     )
-                                else:
-                                    ui.notify(f"Send failed: {result.get('error')}", type='negative', timeout=8000)
-
-                            with ui.row().classes('gap-2'):
-                                ui.button('Send Logs to Dev', icon='cloud_upload', on_click=send_logs_to_dev) \
-                                    .props('color=primary dense outline').style('font-size: 13px;')
-                                ui.button('Download Logs', icon='download', on_click=lambda: ui.navigate.to('/debug-bundle', new_tab=True)) \
-                                    .props('color=secondary dense outline').style('font-size: 13px;')
-
-                            log_cfg = load_logging_config()
-                            ui.label(f"Log dir: {log_cfg['log_dir']}").classes('text-caption').style('color: #666; margin-top: 6px;')
-
-                        # Right column: live Pi terminal
-                        with ui.column().classes('gap-2').style('flex: 1;'):
-                            ui.label('Terminal').classes('text-body1 font-bold mb-1').style('color: #aaa;')
-                            ui.label('Runs shell commands directly on the Pi.').classes('text-caption').style('color: #666;')
-
-                            terminal_log = ui.log().classes('w-full').style(
-                                'height: 320px; font-family: monospace; font-size: 13px; '
-                                'background: #111; color: #d4d4d4; border-radius: 6px; padding: 8px;'
-                            )
-
-                            # PTY-backed persistent shell. A pseudo-terminal gives bash
-                            # a real controlling TTY so sudo password prompts and other
-                            # interactive programs work correctly.
-                            #
-                            # Full ANSI/VT strip:
-                            #   - OSC  \x1B ] ... BEL  — window title, colour palette, etc.
-                            #   - CSI  \x1B [ ...      — colours, cursor movement
-                            #   - Two-char \x1B X      — everything else (SS2, SS3, …)
-                            #   - Standalone BEL / DEL
-                            _ANSI_ESC = re.compile(
-                                r'\x1B\][^\x07\x1B]*(?:\x07|\x1B\\)'  # OSC (title etc.)
-                                r'|\x1B\[[0-?]*[ -/]*[@-~]'            # CSI (colors, cursor)
-                                r'|\x1B[@-Z\\-_]'                      # other 2-char escapes
-                                r'|[\x07\x08\x7f]'                     # BEL, BS, DEL
-                            )
-                            # Matches a typical shell prompt tail: ends with "$ " or "# "
-                            _PROMPT_RE = re.compile(r'[$#]\s*$')
-
-                            shell_state: dict = {
-                                'proc': None, 'master_fd': None,
-                                '_buf': '',             # partial-line accumulator
-                                '_prompt': '',          # pending shell prompt held for combining
-                                '_suppress_echo': None, # command whose PTY echo should be dropped
-                                '_flush_handle': None,  # call_later handle for non-prompt flush
-                            }
-
-                            def _start_shell():
-                                # Clean up any dead previous session
-                                old_fd = shell_state.get('master_fd')
-                                if old_fd is not None:
+                                    return networks, raw
+
+                                async def scan_wifi():
+                                    wifi_status_label.set_text('Scanning…')
+                                    wifi_select.set_options({})
+                                    loop = asyncio.get_event_loop()
                                     try:
-                                        asyncio.get_event_loop().remove_reader(old_fd)
-                                        os.close(old_fd)
-                                    except OSError:
-                                        pass
-                                h = shell_state.get('_flush_handle')
-                                if h:
-                                    h.cancel()
-
-                                master_fd, slave_fd = os.openpty()
-                                # 24 rows × 160 cols — generous width avoids line-wrap artifacts
-                                fcntl.ioctl(slave_fd, termios.TIOCSWINSZ,
-                                            struct.pack('HHHH', 24, 160, 0, 0))
-
-                                proc = subprocess.Popen(
-                                    ['bash'],
-                                    stdin=slave_fd, stdout=slave_fd, stderr=slave_fd,
-                                    close_fds=True,
-                                    start_new_session=True,
-                                    cwd=str(REPO_DIR),
-                                    env={
-                                        **os.environ,
-                                        'TERM': 'xterm-256color',
-                                        'PS1': r'\u@\h:\w\$ ',
-                                        # Prevent .bashrc from reinstalling title sequences
-                                        'PROMPT_COMMAND': '',
-                                    },
-                                )
-                                os.close(slave_fd)  # parent only needs master end
+                                        networks, raw = await loop.run_in_executor(None, _parse_wifi_networks)
+                                    except Exception as exc:
+                                        wifi_status_label.set_text(f'Scan failed: {exc}')
+                                        return
+                                    if not networks:
+                                        # show raw output to help diagnose
+                                        wifi_status_label.set_text(f'No networks parsed. Raw: {raw[:200]!r}')
+                                        return
+                                    options = {}
+                                    for n in networks:
+                                        label = f"{'★ ' if n['in_use'] else ''}{n['ssid']}  ({n['signal']}%{', ' + n['security'] if n['security'] else ''})"
+                                        options[n['ssid']] = label
+                                    wifi_select.set_options(options)
+                                    wifi_status_label.set_text(f"Found {len(networks)} network(s).")
+
+                                def open_connect_dialog():
+                                    ssid = wifi_select.value
+                                    if not ssid:
+                                        ui.notify('Select a network first.', type='warning')
+                                        return
+                                    with ui.dialog() as conn_dlg, ui.card().style('min-width: 320px;'):
+                                        ui.label(f'Connect to "{ssid}"').classes('text-h6')
+                                        pwd_input = ui.input('Password', password=True, password_toggle_button=True).classes('w-full')
+                                        conn_status = ui.label('').classes('text-caption').style('color: #f88;')
+                                        with ui.row().classes('gap-2 justify-end w-full mt-2'):
+                                            ui.button('Cancel', on_click=conn_dlg.close).props('flat dense')
+                                            async def do_connect():
+                                                conn_status.set_text('Connecting…')
+                                                pwd = pwd_input.value
+                                                loop = asyncio.get_event_loop()
+                                                def run_connect():
+                                                    # Delete any stale/incomplete profile for this SSID
+                                                    # (avoids "key-mgmt: property is missing" from old profiles)
+                                                    subprocess.run(
+                                                        ['sudo', 'nmcli', 'connection', 'delete', ssid],
+                                                        capture_output=True, text=True, timeout=10
+                                                    )
+                                                    cmd = ['sudo', 'nmcli', 'device', 'wifi', 'connect', ssid]
+                                                    if pwd:
+                                                        cmd += ['password', pwd]
+                                                    return subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                                                result = await loop.run_in_executor(None, run_connect)
+                                                if result.returncode == 0:
+                                                    refresh_local_ip()  # new network, new address
+                                                    conn_dlg.close()
+                                                    ui.notify(f'Connected to {ssid}', type='positive')
+                                                    wifi_status_label.set_text(f'Connected to {ssid}')
+                                                else:
+                                                    err = result.stderr.strip() or result.stdout.strip()
+                                                    conn_status.set_text(err or 'Connection failed.')
+                                            ui.button('Connect', on_click=do_connect).props('color=primary dense')
+                                    conn_dlg.open()
+
+                                def confirm_forget_wifi():
+                                    with ui.dialog() as dlg, ui.card():
+                                        ui.label('Forget all WiFi networks?').classes('text-h6')
+                                        ui.label(
+                                            'This will delete all saved WiFi connections and reboot the Pi. '
+                                            'On next boot it will create a "fabCNC Setup" hotspot.'
+                                        ).classes('text-body2').style('color: #aaa; max-width: 340px;')
+                                        with ui.row().classes('gap-2 justify-end w-full mt-4'):
+                                            ui.button('Cancel', on_click=dlg.close).props('flat dense')
+                                            def do_forget():
+                                                dlg.close()
+                                                ui.notify('Removing WiFi connections and rebooting…', type='warning')
+                                                subprocess.Popen(
+                                                    'bash -c \''
+                                                    'nmcli -t -f NAME,TYPE connection show'
+                                                    ' | grep ":802-11-wireless$"'
+                                                    ' | cut -d: -f1'
+                                                    ' | while IFS= read -r n; do nmcli connection delete "$n"; done'
+                                                    '; sudo reboot\'',
+                                                    shell=True,
+                                                    stdout=subprocess.DEVNULL,
+                                                    stderr=subprocess.DEVNULL,
+                                                )
+                                            ui.button('Forget & Reboot', on_click=do_forget).props('color=negative dense')
+                                    dlg.open()
+
+                                with ui.row().classes('gap-2 items-center'):
+                                    ui.button('Scan', icon='wifi_find', on_click=scan_wifi).props('dense outline').style('font-size: 13px;')
+                                    ui.button('Connect', icon='wifi', on_click=open_connect_dialog).props('color=primary dense').style('font-size: 13px;')
+                                    ui.button('Forget All & Reboot', icon='wifi_off', on_click=confirm_forget_wifi).props('color=negative dense').style('font-size: 13px;')
+
+                                ui.separator().classes('my-3')
+
+                                ui.label('Debug').classes('text-body1 font-bold mb-1').style('color: #aaa;')
+
+                                async def send_logs_to_dev():
+                                    ui.notify('Sending logs…', type='info')
+                                    loop = asyncio.get_event_loop()
+                                    result = await loop.run_in_executor(None, log_uploader.upload_now, False, "manual")
+                                    if result.get('ok'):
+                                        ui.notify(
+                                            f"Logs sent — {result.get('bytes', 0)//1024} KB",
+                                            type='positive',
+                                        )
+                                    else:
+                                        ui.notify(f"Send failed: {result.get('error')}", type='negative', timeout=8000)
 
-                                # Non-blocking reads so add_reader never stalls
-                                flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
-                                fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
+                                with ui.row().classes('gap-2'):
+                                    ui.button('Send Logs to Dev', icon='cloud_upload', on_click=send_logs_to_dev) \
+                                        .props('color=primary dense outline').style('font-size: 13px;')
+                                    ui.button('Download Logs', icon='download', on_click=lambda: ui.navigate.to('/debug-bundle', new_tab=True)) \
+                                        .props('color=secondary dense outline').style('font-size: 13px;')
 
-                                shell_state.update({
-                                    'proc': proc, 'master_fd': master_fd,
-                                    '_buf': '', '_prompt': '',
-                                    '_suppress_echo': None, '_flush_handle': None,
-                                })
+                                log_cfg = load_logging_config()
+                                ui.label(f"Log dir: {log_cfg['log_dir']}").classes('text-caption').style('color: #666; margin-top: 6px;')
 
-                                def _on_readable():
-                                    try:
-                                        data = os.read(master_fd, 4096)
-                                    except (BlockingIOError, OSError):
-                                        return
+                            # Right column: live Pi terminal
+                            with ui.column().classes('gap-2').style('flex: 1;'):
+                                ui.label('Terminal').classes('text-body1 font-bold mb-1').style('color: #aaa;')
+                                ui.label('Runs shell commands directly on the Pi.').classes('text-caption').style('color: #666;')
+
+                                terminal_log = ui.log(max_lines=500).classes('w-full terminal-log').style(
+                                    'height: 320px; font-family: monospace; font-size: 13px; '
+                                    'background: #111; color: #d4d4d4; border-radius: 6px; padding: 8px;'
+                                )
 
-                                    # Cancel any pending non-prompt flush
-                                    h = shell_state['_flush_handle']
+                                # PTY-backed persistent shell. A pseudo-terminal gives bash
+                                # a real controlling TTY so sudo password prompts and other
+                                # interactive programs work correctly.
+                                #
+                                # Full ANSI/VT strip:
+                                #   - OSC  \x1B ] ... BEL  — window title, colour palette, etc.
+                                #   - CSI  \x1B [ ...      — colours, cursor movement
+                                #   - Two-char \x1B X      — everything else (SS2, SS3, …)
+                                #   - Standalone BEL / DEL
+                                _ANSI_ESC = re.compile(
+                                    r'\x1B\][^\x07\x1B]*(?:\x07|\x1B\\)'  # OSC (title etc.)
+                                    r'|\x1B\[[0-?]*[ -/]*[@-~]'            # CSI (colors, cursor)
+                                    r'|\x1B[@-Z\\-_]'                      # other 2-char escapes
+                                    r'|[\x07\x08\x7f]'                     # BEL, BS, DEL
+                                )
+                                # Matches a typical shell prompt tail: ends with "$ " or "# "
+                                _PROMPT_RE = re.compile(r'[$#]\s*$')
+
+                                shell_state: dict = {
+                                    'proc': None, 'master_fd': None,
+                                    '_buf': '',             # partial-line accumulator
+                                    '_prompt': '',          # pending shell prompt held for combining
+                                    '_suppress_echo': None, # command whose PTY echo should be dropped
+                                    '_flush_handle': None,  # call_later handle for non-prompt flush
+                                }
+
+                                def _start_shell():
+                                    # Clean up any dead previous session
+                                    old_fd = shell_state.get('master_fd')
+                                    if old_fd is not None:
+                                        try:
+                                            asyncio.get_event_loop().remove_reader(old_fd)
+                                            os.close(old_fd)
+                                        except OSError:
+                                            pass
+                                    h = shell_state.get('_flush_handle')
                                     if h:
                                         h.cancel()
-                                        shell_state['_flush_handle'] = None
 
-                                    shell_state['_buf'] += data.decode('utf-8', errors='replace')
-                                    lines = shell_state['_buf'].split('\n')
-                                    shell_state['_buf'] = lines[-1]  # keep partial tail
+                                    master_fd, slave_fd = os.openpty()
+                                    # 24 rows × 160 cols — generous width avoids line-wrap artifacts
+                                    fcntl.ioctl(slave_fd, termios.TIOCSWINSZ,
+                                                struct.pack('HHHH', 24, 160, 0, 0))
+
+                                    proc = subprocess.Popen(
+                                        ['bash'],
+                                        stdin=slave_fd, stdout=slave_fd, stderr=slave_fd,
+                                        close_fds=True,
+                                        start_new_session=True,
+                                        cwd=str(REPO_DIR),
+                                        env={
+                                            **os.environ,
+                                            'TERM': 'xterm-256color',
+                                            'PS1': r'\u@\h:\w\$ ',
+                                            # Prevent .bashrc from reinstalling title sequences
+                                            'PROMPT_COMMAND': '',
+                                        },
+                                    )
+                                    os.close(slave_fd)  # parent only needs master end
 
-                                    for raw in lines[:-1]:
-                                        clean = _ANSI_ESC.sub('', raw).rstrip('\r')
-                                        # Drop the PTY echo of the last sent command
-                                        if (shell_state['_suppress_echo'] is not None
-                                                and clean == shell_state['_suppress_echo']):
-                                            shell_state['_suppress_echo'] = None
-                                            continue
-                                        if clean:
-                                            terminal_log.push(clean)
+                                    # Non-blocking reads so add_reader never stalls
+                                    flags = fcntl.fcntl(master_fd, fcntl.F_GETFL)
+                                    fcntl.fcntl(master_fd, fcntl.F_SETFL, flags | os.O_NONBLOCK)
 
-                                    # Classify the partial line sitting in the buffer
-                                    partial = _ANSI_ESC.sub(
-                                        '', shell_state['_buf']).rstrip('\r').rstrip()
-                                    if not partial:
-                                        return
+                                    shell_state.update({
+                                        'proc': proc, 'master_fd': master_fd,
+                                        '_buf': '', '_prompt': '',
+                                        '_suppress_echo': None, '_flush_handle': None,
+                                    })
 
-                                    if _PROMPT_RE.search(partial):
-                                        # Looks like a shell prompt — hold it so we can
-                                        # combine it with the next command on one line.
-                                        shell_state['_prompt'] = partial
-                                        shell_state['_buf'] = ''
-                                    else:
-                                        # Other partial line (sudo password prompt, etc.)
-                                        # — flush to the log after a short delay.
-                                        def _do_flush():
-                                            buf = shell_state['_buf']
-                                            shell_state['_buf'] = ''
+                                    def _on_readable():
+                                        try:
+                                            data = os.read(master_fd, 4096)
+                                        except (BlockingIOError, OSError):
+                                            return
+
+                                        # Cancel any pending non-prompt flush
+                                        h = shell_state['_flush_handle']
+                                        if h:
+                                            h.cancel()
                                             shell_state['_flush_handle'] = None
-                                            clean = _ANSI_ESC.sub('', buf).rstrip('\r')
+
+                                        shell_state['_buf'] += data.decode('utf-8', errors='replace')
+                                        lines = shell_state['_buf'].split('\n')
+                                        shell_state['_buf'] = lines[-1]  # keep partial tail
+
+                                        for raw in lines[:-1]:
+                                            clean = _ANSI_ESC.sub('', raw).rstrip('\r')
+                                            # Drop the PTY echo of the last sent command
+                                            if (shell_state['_suppress_echo'] is not None
+                                                    and clean == shell_state['_suppress_echo']):
+                                                shell_state['_suppress_echo'] = None
+                                                continue
                                             if clean:
                                                 terminal_log.push(clean)
-                                        shell_state['_flush_handle'] = (
-                                            asyncio.get_event_loop().call_later(0.25, _do_flush)
-                                        )
 
-                                asyncio.get_event_loop().add_reader(master_fd, _on_readable)
-
-                            def _ensure_shell():
-                                proc = shell_state.get('proc')
-                                if proc is None or proc.poll() is not None:
-                                    _start_shell()
-
-                            async def run_terminal_command():
-                                cmd = term_input.value.rstrip('\n')
-                                _ensure_shell()
-
-                                # Cancel any pending non-prompt flush and grab its buffer
-                                h = shell_state.get('_flush_handle')
-                                if h:
-                                    h.cancel()
-                                    shell_state['_flush_handle'] = None
-                                extra = shell_state.get('_buf', '').strip()
-                                if extra:
-                                    terminal_log.push(_ANSI_ESC.sub('', shell_state['_buf']).rstrip('\r'))
-                                    shell_state['_buf'] = ''
-
-                                # Combine the pending shell prompt with the typed command
-                                # so the log reads:  user@host:~$ ls
-                                prompt = shell_state.get('_prompt', '')
-                                shell_state['_prompt'] = ''
-
-                                if prompt:
-                                    terminal_log.push(f'{prompt}{cmd}')
-                                    # Suppress the PTY line-discipline echo that will follow
-                                    shell_state['_suppress_echo'] = cmd if cmd.strip() else None
-                                # If no prompt is pending (e.g. sudo password input) we show
-                                # nothing — avoids echoing sensitive text into the log.
-
-                                log_event('system', 'terminal_command',
-                                          command=cmd[:500] if cmd.strip() else '[enter]')
-                                try:
-                                    os.write(shell_state['master_fd'], (cmd + '\n').encode())
-                                except OSError as exc:
-                                    terminal_log.push(f'[terminal error] {exc}')
-                                term_input.value = ''
+                                        # Classify the partial line sitting in the buffer
+                                        partial = _ANSI_ESC.sub(
+                                            '', shell_state['_buf']).rstrip('\r').rstrip()
+                                        if not partial:
+                                            return
+
+                                        if _PROMPT_RE.search(partial):
+                                            # Looks like a shell prompt — hold it so we can
+                                            # combine it with the next command on one line.
+                                            shell_state['_prompt'] = partial
+                                            shell_state['_buf'] = ''
+                                        else:
+                                            # Other partial line (sudo password prompt, etc.)
+                                            # — flush to the log after a short delay.
+                                            def _do_flush():
+                                                buf = shell_state['_buf']
+                                                shell_state['_buf'] = ''
+                                                shell_state['_flush_handle'] = None
+                                                clean = _ANSI_ESC.sub('', buf).rstrip('\r')
+                                                if clean:
+                                                    terminal_log.push(clean)
+                                            shell_state['_flush_handle'] = (
+                                                asyncio.get_event_loop().call_later(0.25, _do_flush)
+                                            )
+
+                                    asyncio.get_event_loop().add_reader(master_fd, _on_readable)
 
-                            with ui.row().classes('w-full gap-2 items-center'):
-                                ui.label('$').style('color: #4caf50; font-family: monospace; font-size: 16px;')
-                                term_input = ui.input(placeholder='Type a command…') \
-                                    .classes('flex-1').props('outlined dense autocomplete=off autocapitalize=off spellcheck=false')
-                                ui.button('Run', icon='play_arrow', on_click=run_terminal_command) \
-                                    .props('color=primary dense')
+                                def _ensure_shell():
+                                    proc = shell_state.get('proc')
+                                    if proc is None or proc.poll() is not None:
+                                        _start_shell()
 
-                            with ui.row().classes('gap-1'):
-                                ui.button('Clear', icon='clear_all', on_click=lambda: terminal_log.clear()) \
-                                    .props('dense outline').style('font-size: 11px;')
+                                async def run_terminal_command():
+                                    cmd = term_input.value.rstrip('\n')
+                                    _ensure_shell()
+
+                                    # Cancel any pending non-prompt flush and grab its buffer
+                                    h = shell_state.get('_flush_handle')
+                                    if h:
+                                        h.cancel()
+                                        shell_state['_flush_handle'] = None
+                                    extra = shell_state.get('_buf', '').strip()
+                                    if extra:
+                                        terminal_log.push(_ANSI_ESC.sub('', shell_state['_buf']).rstrip('\r'))
+                                        shell_state['_buf'] = ''
+
+                                    # Combine the pending shell prompt with the typed command
+                                    # so the log reads:  user@host:~$ ls
+                                    prompt = shell_state.get('_prompt', '')
+                                    shell_state['_prompt'] = ''
+
+                                    if prompt:
+                                        terminal_log.push(f'{prompt}{cmd}')
+                                        # Suppress the PTY line-discipline echo that will follow
+                                        shell_state['_suppress_echo'] = cmd if cmd.strip() else None
+                                    # If no prompt is pending (e.g. sudo password input) we show
+                                    # nothing — avoids echoing sensitive text into the log.
+
+                                    log_event('system', 'terminal_command',
+                                              command=cmd[:500] if cmd.strip() else '[enter]')
+                                    try:
+                                        os.write(shell_state['master_fd'], (cmd + '\n').encode())
+                                    except OSError as exc:
+                                        terminal_log.push(f'[terminal error] {exc}')
+                                    term_input.value = ''
+
+                                with ui.row().classes('w-full gap-2 items-center'):
+                                    ui.label('$').style('color: #4caf50; font-family: monospace; font-size: 16px;')
+                                    term_input = ui.input(placeholder='Type a command…') \
+                                        .classes('flex-1').props('outlined dense autocomplete=off autocapitalize=off spellcheck=false')
+                                    ui.button('Run', icon='play_arrow', on_click=run_terminal_command) \
+                                        .props('color=primary dense')
+
+                                with ui.row().classes('gap-1'):
+                                    ui.button('Clear', icon='clear_all', on_click=lambda: terminal_log.clear()) \
+                                        .props('dense outline').style('font-size: 11px;')
+
+                                term_input.on('keydown.enter', run_terminal_command)
+
+                                # Start the shell as soon as the tab is built so the prompt is waiting
+                                ui.timer(0.1, _start_shell, once=True)
+
+            # GCODE/System bodies are only built the first time their tab is
+            # opened — the Job tab is what the kiosk shows almost all the time
+            built = {'gcode': False, 'sys': False}
+
+            def _build_once(key, panel, build):
+                # Marked built only once the body is complete; a failed build
+                # leaves an empty panel that is retried on the next visit
+                try:
+                    build()
+                except Exception as exc:
+                    panel.clear()
+                    logger.exception(f"Building the {key} tab failed: {exc}")
+                    ui.notify(f'Could not load this tab: {exc}', type='negative')
+                else:
+                    built[key] = True
 
-                            term_input.on('keydown.enter', run_terminal_command)
+            def on_tab_change(e):
+                value = e.value
+                if not built['gcode'] and (value is gcode_tab or value == 'GCODE'):
+                    _build_once('gcode', gcode_panel, build_gcode_tab)
+                elif not built['sys'] and (value is wifi_tab or value == 'System'):
+                    _build_once('sys', sys_panel, build_system_tab)
 
-                            # Start the shell immediately so the prompt appears on page load
-                            ui.timer(0.1, _start_shell, once=True)
+            tabs.on_value_change(on_tab_change)
 
         # Per-page state for disconnect banner and resume dialog
         _prev_status_local: list = [None]
@@ -3246,5 +3104,10 @@ if __name__ in {"__main__", "__mp_main__"}:
         dark=None,  # Auto-detect system preference
         reload=False,
         show=False,  # Don't auto-open browser (for kiosk mode)
-        storage_secret='fabcnc-storage-secret-2026'
+        storage_secret='fabcnc-storage-secret-2026',
+        # Every bind_*_from source is a BindableProperty (machine_state.flags,
+        # published on the event loop, and tab values), which propagate on
+        # assignment; the polling loop only serves plain-attribute bindings,
+        # so it can wake half as often as the 0.1 s default
+        binding_refresh_interval=0.2,
     )
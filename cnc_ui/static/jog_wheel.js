@@ -0,0 +1,18 @@
+// Circular XY jog wheel: loads the wheel SVG (cached by the browser like any
+// static asset) into the .jog-wheel-svg host and wires up the segment clicks.
+window.mountJogWheel = async (version) => {
+    const host = document.querySelector('.jog-wheel-svg');
+    if (!host || host.dataset.mounted) return;
+    host.dataset.mounted = '1';
+    const res = await fetch(`/static/jog_wheel.svg?v=${version}`);
+    host.innerHTML = await res.text();
+
+    // One delegated listener for all twelve segments; the segment id
+    // (e.g. "x-minus-10") encodes axis, direction and distance.
+    host.addEventListener('click', (e) => {
+        const m = /^([xy])-(plus|minus)-(\d+)$/.exec(e.target.id || '');
+        if (!m) return;
+        const sign = m[2] === 'plus' ? 1 : -1;
+        emitEvent('jog', {axis: m[1].toUpperCase(), distance: sign * parseInt(m[3], 10)});
+    });
+};
@@ -0,0 +1,64 @@
+// Page-level helpers for the main page, loaded from <head> before Fabric.js
+
+// Header state pushed by update_ui: position labels, status label and
+// the canvas toolhead. Each push carries only the changed fields; they are
+// merged here and applied together on the next animation frame.
+window._uiState = {};
+window._uiStateEls = {};
+window.applyState = (s) => {
+    Object.assign(window._uiState, s);
+    if (window._uiStateFrame) return;
+    window._uiStateFrame = requestAnimationFrame(() => {
+        window._uiStateFrame = null;
+        const st = window._uiState;
+        const set = (key, text) => {
+            let el = window._uiStateEls[key];
+            if (!el || !el.isConnected) {
+                el = window._uiStateEls[key] = document.querySelector(`[data-ui-state="${key}"]`);
+            }
+            if (el && el.textContent !== text) el.textContent = text;
+        };
+        if (st.x !== undefined) set('posX', st.x.toFixed(2) + ' mm');
+        if (st.y !== undefined) set('posY', st.y.toFixed(2) + ' mm');
+        if (st.z !== undefined) set('posZ', st.z.toFixed(2) + ' mm');
+        if (st.a !== undefined) set('posA', st.a.toFixed(2) + ' °');
+        if (st.status !== undefined) set('status', st.status);
+        if (st.busy && window.toolpathCanvas) window.toolpathCanvas.updateToolhead(st.x, st.y);
+    });
+};
+
+// Toolpath canvas init, run once per page from init_canvas_after_load. Waits
+// for the canvas script to load (resolves immediately if it already has); the
+// promise settles when init has run, so the server can await it.
+window.initToolpathCanvas = () => new Promise((resolve) => {
+    const start = () => {
+        if (!window.__toolpathCanvasInitDone) {
+            window.__toolpathCanvasInitDone = true;
+            console.log('Initializing toolpath canvas...');
+            window.toolpathCanvas.init('toolpath-canvas');
+        }
+        resolve(true);
+    };
+    if (window.__toolpathCanvasReady) start();
+    else window.addEventListener('toolpathCanvasReady', start, { once: true });
+});
+
+// Jog control — one configured step along `axis`; sent over the existing
+// page websocket rather than a separate HTTP request per press
+window.jogAxis = (axis, direction) => {
+    emitEvent('jog_step', { axis: axis, direction: direction });
+};
+
+// Reset scroll position when window is resized to normal size. Resize fires
+// many times per drag, so the check runs at most once per animation frame.
+let _resizeQueued = false;
+window.addEventListener('resize', () => {
+    if (_resizeQueued) return;
+    _resizeQueued = true;
+    requestAnimationFrame(() => {
+        _resizeQueued = false;
+        if (window.innerWidth >= 1440 && window.innerHeight >= 600) {
+            window.scrollTo(0, 0);
+        }
+    });
+}, { passive: true });
@@ -12,7 +12,8 @@ const MAX_UNDO = 50;
 // Toolpath visualization state
 let toolpathLocked = false;
 let toolpathObjects = [];  // Store toolpath visualization objects (lines, markers, labels)
-let toolheadIndicator = null;  // Realtime toolhead position indicator
+let toolheadOverlay = null;  // Overlay <canvas> for the realtime toolhead indicator
+let toolheadPos = null;  // Last toolhead position in mm {x, y}
 
 // Notch tool state
 let notchMode = false;
@@ -211,6 +212,9 @@ function initCanvas(elementId) {
     drawWorkArea();
     drawRulers();
     
+    // Keep the toolhead overlay in step with zoom, pan and resize
+    canvas.on('after:render', drawToolheadOverlay);
+    
     // Save undo state before any transform starts
     canvas.on('mouse:down', function(e) {
         if (e.target && e.target._isRulerHandle) return;  // no undo save for ruler drags
@@ -697,6 +701,7 @@ function clearShapes() {
     });
     shapes = {};
     shapeData = {};  // Clear stored data too
+    pendingShapeMoves.clear();  // queued moves would re-add cleared shapes
     undoStack = [];  // Clear undo history
     clipboard = null;  // Clear clipboard
     
@@ -818,7 +823,8 @@ function addShape(name, points, colorIndexOrColor, segmentBreaks, segmentTypes)
     // Compensate for Fabric.js v5 Polyline strokeWidth/2 bounding box shift
     polyline.set({ left: polyline.left + polyline.strokeWidth / 2, top: polyline.top + polyline.strokeWidth / 2 });
     canvas.setActiveObject(polyline);
-    canvas.renderAll();
+    // Deferred so a batch of adds (see addShapes) renders once
+    canvas.requestRenderAll();
     
     // Keep ruler handles on top
     ensureRulerHandlesFront();
@@ -835,6 +841,28 @@ function addShape(name, points, colorIndexOrColor, segmentBreaks, segmentTypes)
         'initialTop:', polyline.top.toFixed(1));
 }
 
+// Decode a base64 string of little-endian float64 x,y pairs into [[x, y], ...]
+function decodePoints(b64) {
+    const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+    const flat = new Float64Array(bytes.buffer);
+    const points = new Array(flat.length / 2);
+    for (let i = 0; i < points.length; i++) {
+        points[i] = [flat[2 * i], flat[2 * i + 1]];
+    }
+    return points;
+}
+
+// Add several shapes from a single backend call.
+// entries: [[name, points, colorIndex, segmentBreaks, segmentTypes], ...]
+// where points is either a point array or a base64 float64 buffer.
+function addShapes(entries) {
+    if (!canvas || !entries) return;
+    entries.forEach(e => {
+        const points = typeof e[1] === 'string' ? decodePoints(e[1]) : e[1];
+        addShape(e[0], points, e[2], e[3], e[4]);
+    });
+}
+
 // Constrain shape to work area during drag (real-time)
 function onShapeMoving(e) {
     const obj = e.target;
@@ -1093,12 +1121,7 @@ function onShapeMoved(e) {
     if (notchMode) showNotchNodes();
 
     // Send update to Python backend
-    if (window.emitEvent) {
-        window.emitEvent('shape_moved', {
-            shapeName: name,
-            newPoints: newPoints
-        });
-    }
+    queueShapeMoved(name, newPoints);
 }
 
 // Handle shape scaling via handles
@@ -1875,7 +1898,9 @@ function deleteShape() {
 
     canvas.renderAll();
     
-    // Notify Python
+    // Notify Python. A move for these shapes may still be queued for the next
+    // frame; drop it so the flush can't re-add a shape deleted here.
+    deletedNames.forEach(name => pendingShapeMoves.delete(name));
     if (window.emitEvent) {
         deletedNames.forEach(name => {
             window.emitEvent('shape_deleted', { shapeName: name });
@@ -3062,6 +3087,28 @@ function redrawShapeFromData(shapeName) {
     if (!_batchRedrawMode) canvas.renderAll();
 }
 
+// Shape position updates for Python, coalesced per animation frame: a
+// multi-shape transform (align, distribute, mirror...) or repeated moves of
+// one shape go out as a single 'shapes_moved' event carrying the latest
+// points of each shape, instead of one websocket message per update.
+const pendingShapeMoves = new Map();
+let shapeMoveFrame = null;
+
+function queueShapeMoved(shapeName, points) {
+    pendingShapeMoves.set(shapeName, points);
+    if (shapeMoveFrame !== null) return;
+    shapeMoveFrame = requestAnimationFrame(flushShapeMoves);
+}
+
+function flushShapeMoves() {
+    shapeMoveFrame = null;
+    if (!pendingShapeMoves.size || !window.emitEvent) return;
+    const moves = [];
+    pendingShapeMoves.forEach((points, shapeName) => moves.push({ shapeName: shapeName, newPoints: points }));
+    pendingShapeMoves.clear();
+    window.emitEvent('shapes_moved', { moves: moves });
+}
+
 // Helper: Emit shape update to Python
 function emitShapeUpdate(shapeName) {
     if (!shapeData[shapeName]) return;
@@ -3070,12 +3117,7 @@ function emitShapeUpdate(shapeName) {
     const points = data.originalMmPoints;
     if (!points) return;
     
-    if (window.emitEvent) {
-        window.emitEvent('shape_moved', {
-            shapeName: shapeName,
-            newPoints: points
-        });
-    }
+    queueShapeMoved(shapeName, points);
 }
 
 // Clipboard for copy/paste
@@ -3944,6 +3986,7 @@ function addNotchHints(hints) {
 window.toolpathCanvas = {
     init: initCanvas,
     addShape: addShape,
+    addShapes: addShapes,
     clearShapes: clearShapes,
     getPositions: getShapePositions,
     resize: resizeCanvas,
@@ -4319,43 +4362,62 @@ function clearToolpathObjects() {
     toolpathObjects = [];
 }
 
-// Update toolhead position indicator in realtime
-function updateToolhead(x, y) {
-    if (!canvas) return;
+// Draw the toolhead on a separate overlay canvas stacked over the Fabric
+// canvases. Position updates arrive at 10 Hz while a job runs; redrawing a
+// single dot on the overlay avoids re-rendering the whole Fabric scene.
+function drawToolheadOverlay() {
+    if (!canvas || !canvas.wrapperEl) return;
     
     const TOOLHEAD_COLOR = '#00BFFF';  // Bright blue for toolhead
     const TOOLHEAD_RADIUS = 8;
     
-    // Calculate canvas position
-    const canvasX = toCanvasX(x);
-    const canvasY = toCanvasY(y);
+    // (Re)create the overlay if missing or the Fabric canvas was re-initialised
+    if (!toolheadOverlay || toolheadOverlay.parentNode !== canvas.wrapperEl) {
+        toolheadOverlay = document.createElement('canvas');
+        toolheadOverlay.style.position = 'absolute';
+        toolheadOverlay.style.left = '0';
+        toolheadOverlay.style.top = '0';
+        toolheadOverlay.style.pointerEvents = 'none';
+        canvas.wrapperEl.appendChild(toolheadOverlay);
+    }
     
-    if (toolheadIndicator) {
-        // Update existing indicator position
-        toolheadIndicator.set({
-            left: canvasX - TOOLHEAD_RADIUS,
-            top: canvasY - TOOLHEAD_RADIUS
-        });
-        toolheadIndicator.setCoords();
-    } else {
-        // Create new toolhead indicator
-        toolheadIndicator = new fabric.Circle({
-            left: canvasX - TOOLHEAD_RADIUS,
-            top: canvasY - TOOLHEAD_RADIUS,
-            radius: TOOLHEAD_RADIUS,
-            fill: TOOLHEAD_COLOR,
-            stroke: '#FFFFFF',
-            strokeWidth: 2,
-            selectable: false,
-            evented: false,
-            opacity: 0.9
-        });
-        canvas.add(toolheadIndicator);
+    // Keep the overlay backing store matched to the Fabric canvas size
+    const ratio = window.devicePixelRatio || 1;
+    const w = canvas.getWidth();
+    const h = canvas.getHeight();
+    if (toolheadOverlay.width !== Math.round(w * ratio) || toolheadOverlay.height !== Math.round(h * ratio)) {
+        toolheadOverlay.width = Math.round(w * ratio);
+        toolheadOverlay.height = Math.round(h * ratio);
+        toolheadOverlay.style.width = w + 'px';
+        toolheadOverlay.style.height = h + 'px';
     }
     
-    // Bring toolhead to front
-    canvas.bringToFront(toolheadIndicator);
-    canvas.requestRenderAll();
+    const ctx = toolheadOverlay.getContext('2d');
+    ctx.setTransform(1, 0, 0, 1, 0, 0);
+    ctx.clearRect(0, 0, toolheadOverlay.width, toolheadOverlay.height);
+    if (!toolheadPos) return;
+    
+    // mm -> canvas coords -> screen coords (follows zoom and pan)
+    const p = fabric.util.transformPoint(
+        new fabric.Point(toCanvasX(toolheadPos.x), toCanvasY(toolheadPos.y)),
+        canvas.viewportTransform
+    );
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.globalAlpha = 0.9;
+    ctx.beginPath();
+    ctx.arc(p.x, p.y, TOOLHEAD_RADIUS, 0, Math.PI * 2);
+    ctx.fillStyle = TOOLHEAD_COLOR;
+    ctx.fill();
+    ctx.lineWidth = 2;
+    ctx.strokeStyle = '#FFFFFF';
+    ctx.stroke();
+}
+
+// Update toolhead position indicator in realtime
+function updateToolhead(x, y) {
+    if (!canvas) return;
+    toolheadPos = { x: x, y: y };
+    drawToolheadOverlay();
 }
 
 // ============ LOGGING SHIM ============
@@ -4369,7 +4431,7 @@ function updateToolhead(x, y) {
     const SKIP = new Set([
         'init', 'resize', 'getPositions', 'getCanvasData', 'getNotches',
         'getRulerBounds', 'isToolpathLocked', 'updateToolhead',
-        'saveUndoState', 'addShape', 'clearShapes', 'showToolpath',
+        'saveUndoState', 'addShape', 'addShapes', 'clearShapes', 'showToolpath',
         'clearToolpath', 'restoreNotches', 'restoreNotchesFromLocalStorage'
     ]);
     // Actions that produce huge return values — log a brief summary instead.
@@ -105,6 +105,19 @@ if [ "$SKIP_PACKAIDE" -eq 0 ]; then
     fi
 fi
 
+# ── Fabric.js (served locally) ───────────────────────────────────────────────
+FABRIC_VERSION="5.3.1"
+FABRIC_JS="$SCRIPT_DIR/cnc_ui/static/fabric.min.js"
+echo ""
+echo "==> Fetching Fabric.js ${FABRIC_VERSION} for local serving..."
+if curl -sfL "https://cdnjs.cloudflare.com/ajax/libs/fabric.js/${FABRIC_VERSION}/fabric.min.js" -o "$FABRIC_JS.tmp"; then
+    mv "$FABRIC_JS.tmp" "$FABRIC_JS"
+    echo "    Saved to cnc_ui/static/fabric.min.js"
+else
+    rm -f "$FABRIC_JS.tmp"
+    echo "    WARNING: download failed. The UI will load Fabric.js from the CDN instead."
+fi
+
 # ── Verify ───────────────────────────────────────────────────────────────────
 echo ""
 echo "==> Verifying install..."